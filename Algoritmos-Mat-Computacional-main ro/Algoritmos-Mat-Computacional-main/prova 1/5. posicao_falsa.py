@@ -2,42 +2,71 @@
 
 from math import e
 
-def posicao_falsa(a, b, e1, e2):
+def fator_variante(variante, f_antigo, f_novo):
+    # Fator que multiplica o f do extremo que ficou parado duas vezes seguidas
+    if variante == "illinois":
+        return 0.5
+    if variante == "pegasus":
+        return f_antigo / (f_antigo + f_novo)
+    if variante == "anderson_bjorck":
+        m = 1 - f_novo / f_antigo
+        return m if m > 0 else 0.5
+    raise ValueError("Variante inválida. Use None, 'illinois', 'pegasus' ou 'anderson_bjorck'.")
+
+def posicao_falsa(a, b, e1, e2, variante=None):
+    # f(a) e f(b) ficam guardados: cada iteração avalia f só uma vez
+    fa = f(a)
+    fb = f(b)
+
     # Regra do sinal: para existir raíz nesse intervalo, deve-se atender a esse critério
-    if f(a) * f(b) >= 0:
+    if fa * fb >= 0:
         raise ValueError("Nesse intervalo não existe raíz")
 
     k = 1
+    substituido = None  # Extremo trocado na iteração anterior ("a" ou "b")
 
     print(f"Valores iniciais: a = {a}, b = {b}")
 
     # Verificar se o intervalo é pequeno o suficiente (ou seja, se a precisão é alta)
     if abs(b - a) < e1:
-        if abs(f(a)) < e2:
+        if abs(fa) < e2:
             return a
-        elif abs(f(b)) < e2:
+        elif abs(fb) < e2:
             return b
         else:
             return (a + b) / 2
 
     while True:
         # Calcula o ponto de posição falsa
-        x = (a * f(b) - b * f(a)) / (f(b) - f(a))
+        x = (a * fb - b * fa) / (fb - fa)
+        fx = f(x)
 
         # Verificar se o valor de f(x) é pequeno o suficiente
-        if abs(f(x)) < e2:
+        if abs(fx) < e2:
+            print(f"Iterações: {k}")
             return x
 
         # Atualizar os limites do intervalo
-        if f(a) * f(x) > 0:
+        # Com variante (Illinois, Pegasus, Anderson-Björck), o extremo que ficou parado
+        # duas vezes seguidas tem o f reduzido para não estagnar
+        if fa * fx > 0:
+            if variante is not None and substituido == "a":
+                fb *= fator_variante(variante, fa, fx)
             a = x
+            fa = fx
+            substituido = "a"
         else:
+            if variante is not None and substituido == "b":
+                fa *= fator_variante(variante, fb, fx)
             b = x
+            fb = fx
+            substituido = "b"
 
         print(f"Iteração {k}: a{k} = {a}, b{k}, = {b}")
 
         # Critério de parada baseado no intervalo
         if abs(b - a) < e1:
+            print(f"Iterações: {k}")
             return x
 
         k += 1
@@ -54,4 +83,5 @@ b = 2
 e1 = 1e-6
 e2 = 1e-6
 
-print("Resultado:", posicao_falsa(a, b, e1, e2))
\ No newline at end of file
+print("Resultado:", posicao_falsa(a, b, e1, e2))
+print("Resultado (Illinois):", posicao_falsa(a, b, e1, e2, "illinois"))
\ No newline at end of file
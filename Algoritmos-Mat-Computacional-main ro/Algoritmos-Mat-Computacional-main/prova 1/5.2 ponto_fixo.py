@@ -0,0 +1,156 @@
+# V
+
+import math
+import numpy as np
+
+def passo_aitken(x0, x1, x2):
+    # Extrapolação Δ² de Aitken: x0 - (Δx0)² / Δ²x0
+    denominador = x2 - 2 * x1 + x0
+    if denominador == 0:
+        return x2
+    return x0 - (x1 - x0) ** 2 / denominador
+
+def ponto_fixo(x0, e, max_i, aceleracao=None, max_crescimento=5):
+    # Resolve x = phi(x) iterando x_k+1 = phi(x_k)
+    # aceleracao: None (iteração simples), "aitken" (Δ² sobre a sequência simples)
+    # ou "steffensen" (reinicia a iteração a partir de cada ponto acelerado)
+    # Retorna a aproximação, o número de iterações e a estimativa do fator de contração |phi'|
+    if aceleracao not in (None, "aitken", "steffensen"):
+        raise ValueError("Aceleração inválida. Use None, 'aitken' ou 'steffensen'.")
+
+    x1 = phi(x0)
+    passo_anterior = abs(x1 - x0)
+    if passo_anterior < e:
+        return x1, 1, 0.0
+
+    contracao = math.nan
+    crescimentos = 0  # Quantas vezes seguidas o passo aumentou
+    acelerado = x0
+
+    for k in range(1, max_i + 1):
+        x2 = phi(x1)
+        passo = abs(x2 - x1)
+
+        if not math.isfinite(x2):
+            raise ValueError("A iteração divergiu (valor não finito) na iteração {}.".format(k))
+
+        # |x2 - x1| / |x1 - x0| ≈ |phi'(x*)|: o método simples converge se for < 1
+        if passo_anterior > 0:
+            contracao = passo / passo_anterior
+
+        if aceleracao is None:
+            if passo < e:
+                return x2, k + 1, contracao
+            x0, x1 = x1, x2
+
+        else:
+            novo = passo_aitken(x0, x1, x2)
+            if abs(novo - acelerado) < e or passo < e:
+                return novo, k + 1, contracao
+            acelerado = novo
+
+            if aceleracao == "aitken":
+                x0, x1 = x1, x2
+            else:
+                # Steffensen: recomeça a partir do ponto acelerado
+                x0 = novo
+                x1 = phi(x0)
+                passo = abs(x1 - x0)
+                if passo < e:
+                    return x1, k + 1, contracao
+
+        # Detecção de divergência: com aceleração de Steffensen o método pode convergir
+        # mesmo com |phi'| > 1, então só a iteração simples/Aitken é interrompida
+        if aceleracao != "steffensen":
+            crescimentos = crescimentos + 1 if contracao >= 1 else 0
+            if crescimentos >= max_crescimento:
+                raise ValueError("A iteração diverge: fator de contração estimado {:.4f} >= 1.".format(contracao))
+
+        passo_anterior = passo
+
+    raise ValueError("O método não convergiu em {} iterações.".format(max_i))
+
+def ponto_fixo_vetorizado(phi, x0, e, max_i, aceleracao=None, max_crescimento=5):
+    # Itera várias funções de ponto fixo independentes ao mesmo tempo
+    # phi recebe o array inteiro e devolve phi aplicado em cada posição
+    # (ex.: phi = lambda x: np.cos(c * x) com c sendo um array de parâmetros)
+    # Posições que convergiram ou divergiram ficam congeladas
+    # Retorna (x, iterações por posição, convergiu, fator de contração estimado)
+    if aceleracao not in (None, "aitken", "steffensen"):
+        raise ValueError("Aceleração inválida. Use None, 'aitken' ou 'steffensen'.")
+
+    x0 = np.array(x0, dtype=float)
+    x1 = phi(x0)
+    passo_anterior = np.abs(x1 - x0)
+
+    convergiu = passo_anterior < e
+    ativo = ~convergiu
+    resultado = np.where(convergiu, x1, x0)
+    iteracoes = np.ones(x0.shape, dtype=int)
+    contracao = np.full(x0.shape, np.nan)
+    crescimentos = np.zeros(x0.shape, dtype=int)
+    acelerado = x0.copy()
+
+    for k in range(1, max_i + 1):
+        if not ativo.any():
+            break
+
+        with np.errstate(all="ignore"):
+            x2 = phi(x1)
+            passo = np.abs(x2 - x1)
+            contracao = np.where(ativo & (passo_anterior > 0), passo / passo_anterior, contracao)
+
+            if aceleracao is None:
+                novo = x2
+                pronto = passo < e
+            else:
+                denominador = x2 - 2 * x1 + x0
+                novo = np.where(denominador != 0, x0 - (x1 - x0) ** 2 / denominador, x2)
+                pronto = (np.abs(novo - acelerado) < e) | (passo < e)
+
+        pronto &= ativo
+        resultado = np.where(pronto, novo, resultado)
+        iteracoes = np.where(ativo, k + 1, iteracoes)
+        convergiu |= pronto
+
+        divergiu = ativo & ~np.isfinite(x2)
+        if aceleracao != "steffensen":
+            crescimentos = np.where(contracao >= 1, crescimentos + 1, 0)
+            divergiu |= ativo & (crescimentos >= max_crescimento)
+        ativo &= ~(pronto | divergiu)
+
+        if aceleracao == "steffensen":
+            acelerado = novo
+            x0 = np.where(ativo, novo, x0)
+            with np.errstate(all="ignore"):
+                x1 = phi(x0)
+            passo = np.abs(x1 - x0)
+        else:
+            acelerado = novo
+            x0, x1 = np.where(ativo, x1, x0), np.where(ativo, x2, x1)
+
+        resultado = np.where(ativo, x1 if aceleracao is None else novo, resultado)
+        passo_anterior = passo
+
+    return resultado, iteracoes, convergiu, contracao
+
+# Exemplo:
+def phi(x):
+    return math.cos(x)
+
+# precisão
+e = 1e-10
+
+# chute inicial
+x0 = 1
+
+for aceleracao in (None, "aitken", "steffensen"):
+    x, k, q = ponto_fixo(x0, e, 1000, aceleracao)
+    print(f"{aceleracao}: x = {x}, iterações = {k}, fator de contração ≈ {q:.4f}")
+
+# Vários mapas ao mesmo tempo: x = cos(c·x) para c entre 0.1 e 1
+c = np.linspace(0.1, 1, 10)
+x, k, convergiu, q = ponto_fixo_vetorizado(lambda x: np.cos(c * x), np.ones_like(c), e, 1000, "steffensen")
+print("x =", x)
+print("iterações =", k)
+print("convergiu =", convergiu)
@@ -11,12 +11,13 @@ def decomposicao_LU_pivot(A):
         Matriz quadrada de coeficientes do sistema, que será decomposta.
 
     Retorno:
-    P, L, U : np.array, np.array, np.array
-        Matrizes de permutação (P), triangular inferior (L) e triangular superior (U).
+    piv, L, U : np.array, np.array, np.array
+        Vetor de pivôs (piv), matriz triangular inferior (L) e triangular superior (U).
+        A linha i de PA é a linha piv[i] de A, então aplicar a permutação em b é só fazer b[piv].
         Essas matrizes representam a decomposição LU da matriz A.
     """
     n = len(A)  # Obtendo a ordem (número de linhas ou colunas) da matriz quadrada A
-    P = np.eye(n)  # Inicializando a matriz de permutação como a matriz identidade de tamanho n
+    piv = np.arange(n)  # Vetor de pivôs [0, 1, ..., n-1]: guarda só a ordem das linhas (n inteiros, em vez de uma matriz n x n)
     L = np.eye(n)  # Inicializando a matriz triangular inferior L como a matriz identidade de tamanho n
     U = A.astype(float)  # Copiando A para U (em formato float, pois pode ocorrer divisão)
 
@@ -25,9 +26,9 @@ def decomposicao_LU_pivot(A):
         # Pivoteamento parcial: escolhe o maior elemento na coluna k (abaixo ou na diagonal)
         pivot = np.argmax(np.abs(U[k:, k])) + k  # Encontrando o índice do maior valor absoluto na coluna k
         if pivot != k:
-            # Se o pivô não estiver na posição esperada, trocamos as linhas de U e também ajustamos P
+            # Se o pivô não estiver na posição esperada, trocamos as linhas de U e também ajustamos o vetor de pivôs
             U[[k, pivot]] = U[[pivot, k]]  # Troca as linhas k e pivot na matriz U
-            P[[k, pivot]] = P[[pivot, k]]  # Troca as linhas k e pivot na matriz P (matriz de permutação)
+            piv[[k, pivot]] = piv[[pivot, k]]  # Troca as posições k e pivot no vetor de pivôs
             if k > 0:
                 L[[k, pivot], :k] = L[[pivot, k], :k]  # Troca as linhas de L para manter a estrutura triangular
 
@@ -36,8 +37,50 @@ def decomposicao_LU_pivot(A):
             L[i, k] = U[i, k] / U[k, k]  # Calculando os multiplicadores da eliminação e armazenando em L
             U[i, k:] -= L[i, k] * U[k, k:]  # Subtraímos da linha i da matriz U a multiplicação da linha k
 
-    # Retorna as três matrizes: P, L e U que representam a decomposição LU com pivoteamento
-    return P, L, U
+    # Retorna o vetor de pivôs e as matrizes L e U que representam a decomposição LU com pivoteamento
+    return piv, L, U
+
+class FatoracaoLU:
+    """
+    Guarda a decomposição LU de A para resolver vários sistemas Ax = b com a mesma matriz A.
+    A decomposição (a parte cara, O(n³)) é feita uma única vez no construtor; cada chamada de solve
+    faz só as substituições direta e retroativa (O(n²) por lado direito).
+
+    Parâmetros:
+    A : np.array
+        Matriz quadrada de coeficientes do sistema.
+    """
+
+    def __init__(self, A):
+        piv, L, U = decomposicao_LU_pivot(np.asarray(A))  # Decompõe A uma única vez
+        self.LU = np.tril(L, -1) + U  # L (sem a diagonal de 1s) e U guardadas juntas numa só matriz
+        self.piv = piv  # Vetor de pivôs: Pb = b[piv]
+
+    def solve(self, B):
+        """
+        Resolve AX = B usando a decomposição guardada.
+
+        Parâmetros:
+        B : np.array
+            Vetor de tamanho n ou matriz (n, k) com k lados direitos (um sistema por coluna).
+
+        Retorno:
+        X : np.array
+            Solução com o mesmo formato de B (cada coluna de X resolve a coluna correspondente de B).
+        """
+        n = len(self.LU)  # Ordem do sistema
+        y = np.array(B, dtype=float)[self.piv]  # Aplica a permutação: reordena as linhas de B (equivale a P * B)
+
+        # Substituição direta (Ly = PB): todas as colunas de B são tratadas juntas em cada linha
+        for i in range(n):
+            y[i] -= np.dot(self.LU[i, :i], y[:i])  # A diagonal de L é 1, então não há divisão
+
+        # Substituição retroativa (Ux = y), da última linha para a primeira
+        x = y  # x reaproveita o array de y (cada y[i] só é usado antes de x[i] ser escrito)
+        for i in range(n - 1, -1, -1):
+            x[i] = (y[i] - np.dot(self.LU[i, i+1:], x[i+1:])) / self.LU[i, i]
+
+        return x  # Retorna a solução (vetor ou matriz, conforme B)
 
 def resolver_sistema_LU(A, b):
     """
@@ -54,32 +97,9 @@ def resolver_sistema_LU(A, b):
     x : np.array
         Vetor solução do sistema.
     """
-    # Chamamos a função decomposicao_LU_pivot para obter as matrizes P, L e U a partir de A
-    P, L, U = decomposicao_LU_pivot(A)
-
-    # Primeira etapa: resolver Pb = L(Ux) = b. Isso envolve modificar b com a matriz de permutação P.
-    b_modificado = np.dot(P, b)  # Aplica a matriz de permutação P ao vetor b, ou seja, b' = P * b
-
-    # Segunda etapa: resolver Ly = Pb (substituição direta)
-    # O vetor y é o vetor intermediário entre Pb e a solução final x
-    n = len(b)  # Obtém o número de variáveis (tamanho de b)
-    y = np.zeros(n)  # Inicializa o vetor y, que armazenará as soluções intermediárias
-
-    # Realiza a substituição direta para resolver Ly = Pb
-    # Para cada linha i, calculamos o valor de y[i] a partir das equações da matriz triangular inferior L
-    for i in range(n):  # Passa por todas as linhas de L
-        y[i] = b_modificado[i] - np.dot(L[i, :i], y[:i])  # Subtrai a soma dos produtos já calculados para y
-
-    # Terceira etapa: resolver Ux = y (substituição retroativa)
-    # O vetor x será calculado da última linha para a primeira, já que U é triangular superior
-    x = np.zeros(n)  # Inicializa o vetor x, que armazenará a solução final
-
-    # Realiza a substituição retroativa para resolver Ux = y
-    for i in range(n - 1, -1, -1):  # Passa pelas linhas de U de baixo para cima
-        x[i] = (y[i] - np.dot(U[i, i+1:], x[i+1:])) / U[i, i]  # Calcula x[i] com base nas equações de U
-
-    # Retorna a solução do sistema, que é o vetor x
-    return x
+    # Cria a decomposição LU de A e resolve o sistema com ela.
+    # Para resolver vários sistemas com a mesma matriz A, crie FatoracaoLU(A) uma vez e chame solve(b) para cada b.
+    return FatoracaoLU(A).solve(b)
 
 
 
@@ -98,9 +118,9 @@ def resolver_sistema_LU(A, b):
 # 𝐿
 # L (triangular inferior) e 
 # 𝑈
-# U (triangular superior), com uma matriz de permutação 
+# U (triangular superior), com um vetor de pivôs piv (que representa a matriz de permutação 
 # 𝑃
-# P para garantir a estabilidade numérica.
+# P sem precisar montá-la) para garantir a estabilidade numérica.
 
 # Objetivo: Decompor a matriz 
 # 𝐴
@@ -109,18 +129,17 @@ def resolver_sistema_LU(A, b):
 # L e 
 # 𝑈
 # U tal que 
+# 𝑃
 # 𝐴
 # =
-# 𝑃
-# ⋅
 # 𝐿
 # ⋅
 # 𝑈
-# A=P⋅L⋅U. Aqui, 
+# PA=L⋅U. Aqui, a permutação 
 # 𝑃
-# P é a matriz de permutação que troca linhas da matriz 
+# P não é guardada como matriz: o vetor de pivôs piv diz que a linha i de PA é a linha piv[i] de 
 # 𝐴
-# A para garantir que o maior valor possível seja usado como pivô (elemento diagonal) para cada etapa da eliminação.
+# A. As trocas de linhas garantem que o maior valor possível seja usado como pivô (elemento diagonal) para cada etapa da eliminação, e cada troca em U é acompanhada da troca das mesmas posições em piv.
 
 # Processo de Pivoteamento: Em cada iteração do algoritmo, seleciona-se o maior elemento da coluna 
 # 𝑘
@@ -148,11 +167,9 @@ def resolver_sistema_LU(A, b):
 
 # Etapa 1 (Substituição Direta):
 
-# Primeiro, modificamos o vetor 
+# Primeiro, reordenamos o vetor 
 # 𝑏
-# b pela matriz de permutação 
-# 𝑃
-# P (calculada na decomposição LU). Isso é feito para garantir que as permutações feitas em 
+# b pelo vetor de pivôs piv (calculado na decomposição LU): Pb é simplesmente b[piv], sem montar nem multiplicar a matriz de permutação. Isso é feito para garantir que as trocas de linhas feitas em 
 # 𝐴
 # A também sejam refletidas em 
 # 𝑏
@@ -163,7 +180,7 @@ def resolver_sistema_LU(A, b):
 # =
 # 𝑃
 # 𝑏
-# Ly=Pb utilizando substituição direta. A matriz 
+# Ly=Pb (com Pb = b[piv]) utilizando substituição direta. A matriz 
 # 𝐿
 # L é triangular inferior, o que permite que resolvamos 
 # 𝑦
@@ -228,3 +245,11 @@ def resolver_sistema_LU(A, b):
 # print("Solução do sistema: ", x)  # Exibe a solução
 # Esse código vai resolver o sistema linear utilizando decomposição LU com pivoteamento parcial.
 
+# 6. Classe FatoracaoLU (vários sistemas com a mesma matriz)
+# Quando a mesma matriz A aparece com muitos vetores b, não é preciso refazer a decomposição a cada vez:
+
+# fatoracao = FatoracaoLU(A)  # Decompõe A uma única vez
+# x1 = fatoracao.solve(b)  # Cada solve faz só as substituições
+# B = np.array([[1, 0], [2, 1], [3, 0]], dtype=float)  # Dois lados direitos, um por coluna
+# X = fatoracao.solve(B)  # Resolve os dois sistemas de uma vez
+
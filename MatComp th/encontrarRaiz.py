@@ -1,4 +1,59 @@
-from math import e, log
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from math import ceil, e, isfinite, log
+import os
+
+import numpy as np
+
+class OrcamentoEsgotado(RuntimeError):
+    pass
+
+class FuncaoContada:
+    # Envolve uma função guardando os últimos pares (x, f(x)), contando as avaliações
+    # e limitando o total de avaliações. Pode ser passada no lugar da função em
+    # qualquer método deste arquivo (mesma interface da FuncaoContada de raizes/avaliacao.py)
+    def __init__(self, f, tamanho_cache=16, orcamento=None):
+        self.f = f
+        self.tamanho_cache = tamanho_cache
+        self.orcamento = orcamento
+        self.cache = OrderedDict()
+        self.chamadas = 0
+        self.avaliacoes = 0
+        self.acertos = 0
+
+    def __call__(self, x):
+        self.chamadas += 1
+        if np.ndim(x) > 0:
+            # Arrays não passam pelo cache, mas cada elemento conta como avaliação
+            self.verificar_orcamento(np.size(x))
+            y = self.f(x)
+            self.avaliacoes += np.size(x)
+            return y
+
+        if x in self.cache:
+            self.acertos += 1
+            self.cache.move_to_end(x)
+            return self.cache[x]
+
+        self.verificar_orcamento(1)
+        y = self.f(x)
+        self.avaliacoes += 1
+        self.cache[x] = y
+        if len(self.cache) > self.tamanho_cache:
+            self.cache.popitem(last=False)
+        return y
+
+    def verificar_orcamento(self, n):
+        if self.orcamento is not None and self.avaliacoes + n > self.orcamento:
+            raise OrcamentoEsgotado(f"Orçamento de {self.orcamento} avaliações de f esgotado.")
+
+    def zerar(self):
+        # Limpa o cache e os contadores (o orçamento volta a ficar disponível)
+        self.cache.clear()
+        self.chamadas = 0
+        self.avaliacoes = 0
+        self.acertos = 0
 
 def ha_raiz(funcao, limA, limB):
     if funcao(limA) * funcao(limB) < 0:
@@ -17,15 +72,57 @@ def tabela_sinais(funcao, limA, limB):
         n += passo
     return tabela
 
+def avaliar_pontos(funcao, xs):
+    # Avalia a função em todos os pontos de uma vez; se ela não aceitar arrays, avalia um por um
+    xs = np.asarray(xs, dtype=float)
+    try:
+        ys = np.asarray(funcao(xs), dtype=float)
+        if ys.shape == xs.shape:
+            return ys
+    except (TypeError, ValueError):
+        pass
+    return np.array([funcao(x) for x in xs.ravel()], dtype=float).reshape(xs.shape)
+
+def isolar_raizes(funcao, limA, limB, pontos=1000, subdivisoes=16, max_nivel=6):
+    # Amostra a função numa malha e guarda os intervalos com mudança de sinal.
+    # Mínimos locais de |f| sem mudança de sinal são refinados quando a parábola
+    # pelos três pontos vizinhos cruza o zero (possível par de raízes escondido)
+    xs = np.linspace(limA, limB, pontos + 1).reshape(1, -1)
+    ys = avaliar_pontos(funcao, xs)
+    intervalos = []
+    zeros = []
+
+    for nivel in range(max_nivel + 1):
+        inicio = 0 if nivel == 0 else 1
+        fim = ys.shape[1] if nivel == 0 else ys.shape[1] - 1
+        zeros.append(xs[:, inicio:fim][ys[:, inicio:fim] == 0])
+
+        troca = ys[:, :-1] * ys[:, 1:] < 0
+        intervalos.append(np.column_stack((xs[:, :-1][troca], xs[:, 1:][troca])))
+
+        if nivel == max_nivel:
+            break
+
+        y0, y1, y2 = ys[:, :-2], ys[:, 1:-1], ys[:, 2:]
+        curvatura = y0 - 2 * y1 + y2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vertice = y1 - (y2 - y0) ** 2 / (8 * curvatura)
+        suspeito = (y0 * y1 > 0) & (y1 * y2 > 0) & (abs(y1) < abs(y0)) & (abs(y1) < abs(y2))
+        suspeito &= (curvatura != 0) & (vertice * y1 <= 0)
+        if not suspeito.any():
+            break
+
+        esquerda = xs[:, :-2][suspeito]
+        direita = xs[:, 2:][suspeito]
+        xs = esquerda[:, None] + (direita - esquerda)[:, None] * np.linspace(0, 1, subdivisoes + 1)
+        ys = avaliar_pontos(funcao, xs)
+
+    zeros = np.unique(np.concatenate(zeros))
+    intervalos = np.concatenate(intervalos + [np.column_stack((zeros, zeros))])
+    return intervalos[np.argsort(intervalos[:, 0], kind="stable")]
+
 def tabela_raizes(funcao, limA, limB, iteracoes=1000):
-    passo = abs(limA - limB) / iteracoes
-    n = limA
-    tabela = []
-    while n <= limB:
-        if ha_raiz(funcao, n, n + passo):
-            tabela.append((n, n + passo))
-        n += passo
-    return tabela
+    return [tuple(coords) for coords in isolar_raizes(funcao, limA, limB, iteracoes).tolist()]
 
 def bisseccao(funcao, limA, limB, precisao = 0.1):
     meio = (limA + limB) / 2
@@ -38,40 +135,107 @@ def bisseccao(funcao, limA, limB, precisao = 0.1):
     return meio
 
 def posicao_falsa(funcao, limA, limB, precisao = 0.1):
+    # Extremo que já é raiz (inclusive o intervalo degenerado (z, z) da tabela_raizes)
+    if funcao(limA) == 0:
+        return limA
+    if funcao(limB) == 0:
+        return limB
     meio = (limA * funcao(limB) - limB * funcao(limA)) / (funcao(limB) - funcao(limA))
     while abs(limA - limB) > precisao:
         if funcao(limA) * funcao(meio) < 0:
             limB = meio
         else:
             limA = meio
+        anterior = meio
         meio = (limA * funcao(limB) - limB * funcao(limA)) / (funcao(limB) - funcao(limA))
+        # Um dos extremos pode nunca se mover; para quando o ponto não muda mais
+        if meio == anterior:
+            break
     return meio
 
-def metodo_newton(funcao, derivada, raiz, precisao=0.1):
-    iter_max = 100000
-
-    raiz1 = raiz - (funcao(raiz) / derivada(raiz))
-    i = 0
-    while (abs(raiz1 - raiz) > precisao) or i < iter_max:
-        raiz = raiz1 - (funcao(raiz1) / derivada(raiz1))
+def metodo_newton(funcao, derivada, raiz, precisao=0.1, iter_max=1000, retornar_status=False):
+    # Retorna a raiz; com retornar_status=True retorna (raiz, convergiu), onde convergiu
+    # diz se o passo ficou menor que a precisão antes de iter_max
+    try:
         raiz1 = raiz - (funcao(raiz) / derivada(raiz))
-        i += 1
-    return raiz
+        i = 0
+        while (abs(raiz1 - raiz) > precisao) and i < iter_max:
+            raiz = raiz1 - (funcao(raiz1) / derivada(raiz1))
+            raiz1 = raiz - (funcao(raiz) / derivada(raiz))
+            i += 1
+        convergiu = abs(raiz1 - raiz) <= precisao
+    except (ZeroDivisionError, OverflowError):
+        # Derivada nula ou iterações explodindo
+        convergiu = False
+    return (raiz, convergiu) if retornar_status else raiz
 
-def encontrar_raizes(funcao, limA, limB, metodo, derivada=None, iteracoes=1000, precisao=0.1):
-    # Encontra intervalos das raízes da função
+def resolver_intervalos(funcao, limA, limB, metodo, derivada=None, iteracoes=1000, precisao=0.1):
+    # Encontra intervalos das raízes da função e refina cada um.
+    # Retorna uma lista de (raiz, convergiu)
     tabela = tabela_raizes(funcao, limA, limB, iteracoes)
     raizes = []
     for coords in tabela:
+        if coords[0] == coords[1]:
+            # A função é exatamente zero num ponto da malha
+            raizes.append((coords[0], True))
+            continue
         match metodo:
             case 0:
-                raizes.append(bisseccao(funcao, coords[0], coords[1], precisao))
+                raizes.append((bisseccao(funcao, coords[0], coords[1], precisao), True))
             case 1:
-                raizes.append(posicao_falsa(funcao, coords[0], coords[1], precisao))
+                raizes.append((posicao_falsa(funcao, coords[0], coords[1], precisao), True))
             case 2:
-                raizes.append(metodo_newton(funcao, derivada, coords[0], precisao))
+                raizes.append(metodo_newton(funcao, derivada, coords[0], precisao, retornar_status=True))
     return raizes
 
+def encontrar_raizes(funcao, limA, limB, metodo, derivada=None, iteracoes=1000, precisao=0.1):
+    return [raiz for raiz, _ in resolver_intervalos(funcao, limA, limB, metodo, derivada, iteracoes, precisao)]
+
+def resolver_lote(familia, lote, limA, limB, metodo, derivada=None, iteracoes=1000, precisao=0.1):
+    # Resolve f(x; p) = 0 para cada parâmetro p do lote (executado dentro de um processo)
+    resultados = []
+    for p in lote:
+        resultado = {"parametro": p, "raizes": [], "nao_convergidas": [], "erro": None}
+        try:
+            funcao = lambda x: familia(x, p)
+            deriv = (lambda x: derivada(x, p)) if derivada is not None else None
+            for raiz, convergiu in resolver_intervalos(funcao, limA, limB, metodo, deriv, iteracoes, precisao):
+                # Newton pode parar em iter_max ou escapar para fora do intervalo
+                if convergiu and isfinite(raiz) and limA <= raiz <= limB:
+                    resultado["raizes"].append(raiz)
+                else:
+                    resultado["nao_convergidas"].append(raiz)
+        except Exception as erro:
+            resultado["erro"] = f"{type(erro).__name__}: {erro}"
+        resultados.append(resultado)
+    return resultados
+
+def varrer_parametros(familia, parametros, limA, limB, metodo, derivada=None, iteracoes=1000, precisao=0.1,
+                      processos=None, tamanho_lote=None):
+    # Encontra as raízes de f(x; p) para cada p, dividindo os parâmetros em lotes
+    # entre vários processos. familia(x, p) e derivada(x, p) precisam ser funções
+    # definidas no nível do módulo (para poderem ser enviadas aos processos).
+    # Retorna um dicionário por parâmetro, na mesma ordem de parametros, com as
+    # raízes, as não convergidas e a mensagem de erro (ou None)
+    parametros = list(parametros)
+    if not parametros:
+        return []
+
+    processos = processos or os.cpu_count() or 1
+    if tamanho_lote is None:
+        # Alguns lotes por processo para equilibrar a carga sem muito custo de comunicação
+        tamanho_lote = max(1, ceil(len(parametros) / (processos * 4)))
+    lotes = [parametros[i:i + tamanho_lote] for i in range(0, len(parametros), tamanho_lote)]
+
+    tarefa = partial(resolver_lote, familia, limA=limA, limB=limB, metodo=metodo, derivada=derivada,
+                     iteracoes=iteracoes, precisao=precisao)
+    resultados = []
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        # executor.map devolve os lotes na ordem em que foram enviados
+        for parcial in executor.map(tarefa, lotes):
+            resultados.extend(parcial)
+    return resultados
+
 
 def exemploA(x):
     return (x**3) - (9*x) + 3
@@ -87,6 +251,18 @@ def exemploC(x):
     if x > 0:
         return x * log(x, 10) - 1
 
-print(encontrar_raizes(exemploA, -10, 10, 0, precisao=0.000001))
-print(encontrar_raizes(exemploA, -10, 10, 1, precisao=0.000001))
-print(encontrar_raizes(exemploA, -10, 10, 2, derivada=derivadaA, precisao=0.000001))
+def familiaA(x, p):
+    return (x**3) - (p*x) + 3
+
+if __name__ == "__main__":
+    print(encontrar_raizes(exemploA, -10, 10, 0, precisao=0.000001))
+    print(encontrar_raizes(exemploA, -10, 10, 1, precisao=0.000001))
+    print(encontrar_raizes(exemploA, -10, 10, 2, derivada=derivadaA, precisao=0.000001))
+
+    # funcao = FuncaoContada(exemploA, orcamento=100000)
+    # print(encontrar_raizes(funcao, -10, 10, 1, precisao=0.000001))
+    # print(funcao.chamadas, funcao.avaliacoes, funcao.acertos)
+
+    # resultados = varrer_parametros(familiaA, [1 + i / 100 for i in range(10000)], -10, 10, 0, precisao=0.000001)
+    # for resultado in resultados[:5]:
+    #     print(resultado)
@@ -39,11 +39,13 @@ def eliminacao_gauss(matriz):
     return matriz
 
 def fatoracao_lu(matriz):
+    # Retorna L, U e o vetor de pivos: a linha i de U veio da linha pivos[i] da matriz
+    # (guardar so os indices no lugar da matriz de permutacao economiza n^2 de memoria)
     tam_matriz = len(matriz)
 
-    matriz_u = matriz.copy()
+    matriz_u = [linha[:tam_matriz] for linha in matriz]
     matriz_l = gerar_matriz_identidade(tam_matriz)
-    matriz_p = matriz_l.copy()
+    pivos = list(range(tam_matriz))
 
     for i in range(tam_matriz - 1):
         max = i
@@ -52,11 +54,8 @@ def fatoracao_lu(matriz):
                 max = j
 
         if max != i:
-            matriz_u[[i, max]] = matriz_u[[max, i]]
-            for j in range(tam_matriz):
-                matriz_u[i][j], matriz_u[max][j] = matriz_u[max][j], matriz_u[i][j]
-            for j in range(tam_matriz):
-                matriz_p[i][j], matriz_p[max][j] = matriz_p[max][j], matriz_p[i][j]
+            matriz_u[i], matriz_u[max] = matriz_u[max], matriz_u[i]
+            pivos[i], pivos[max] = pivos[max], pivos[i]
 
             for j in range(i):
                 matriz_l[i][j] , matriz_l[max][j] = matriz_l[max][j], matriz_l[i][j]
@@ -65,18 +64,14 @@ def fatoracao_lu(matriz):
             matriz_l[j][i] = matriz_u[j][i] / matriz_u[i][i]
             for k in range(i, tam_matriz):
                 matriz_u[j][k] -= matriz_l[j][i] * matriz_u[i][k]
-    return matriz_l, matriz_u, matriz_p
+    return matriz_l, matriz_u, pivos
 
 def resolver_lu(matriz):
     tam_matriz = len(matriz)
-    matriz_l, matriz_u, matriz_p = fatoracao_lu(matriz)
+    matriz_l, matriz_u, pivos = fatoracao_lu(matriz)
 
-    res_permutado = []
-    for i in range(tam_matriz):
-        sum = 0
-        for j in range(tam_matriz):
-            sum += matriz[i][tam_matriz] * matriz_p[j][i]
-        res_permutado.append(sum)
+    # Pb: so reordena os termos independentes pelos pivos
+    res_permutado = [matriz[pivos[i]][tam_matriz] for i in range(tam_matriz)]
 
 
     vars = [0] * tam_matriz
@@ -108,15 +103,21 @@ def gauss_jacobi(matriz, aprox):
     if alpha >= 1:
         return []
 
+    # Guarda só os coeficientes não nulos fora da diagonal de cada linha (já divididos
+    # pela diagonal), assim cada iteração percorre O(nnz) termos em vez de O(n^2)
+    coeficientes = []
+    for i in range(tam_matriz):
+        coeficientes.append([(j, matriz[i][j] / matriz[i][i]) for j in range(tam_matriz)
+                             if i != j and matriz[i][j] != 0])
+
     if not aprox:
         aprox = [0] * tam_matriz
     for n in range(1000000):
         teste = aprox[0]
         for i in range(tam_matriz):
             aprox[i] = (matriz[i][tam_matriz] / matriz[i][i])
-            for j in range(tam_matriz):
-                if i != j:
-                    aprox[i] -= (matriz[i][j] / matriz[i][i]) * aprox[j]
+            for j, coeficiente in coeficientes[i]:
+                aprox[i] -= coeficiente * aprox[j]
         if abs(aprox[0] - teste) < 0.01:
             break
     return aprox
@@ -9,11 +9,12 @@ def decomposicao_LU_pivot(A):
         Matriz quadrada de coeficientes do sistema.
 
     Retorno:
-    P, L, U : np.array, np.array, np.array
-        Matrizes de permutação, triangular inferior e triangular superior, respectivamente.
+    piv, L, U : np.array, np.array, np.array
+        Vetor de pivôs (a linha i de PA é a linha piv[i] de A, então Pb = b[piv]),
+        matriz triangular inferior e triangular superior, respectivamente.
     """
     n = len(A)
-    P = np.eye(n)  # Matriz identidade para armazenar permutações
+    piv = np.arange(n)  # Vetor de pivôs no lugar da matriz de permutação (n inteiros em vez de n²)
     L = np.eye(n)  # Matriz triangular inferior inicializada como identidade
     U = A.astype(float)  # Copia de A para iniciar U
 
@@ -22,7 +23,7 @@ def decomposicao_LU_pivot(A):
         pivot = np.argmax(np.abs(U[k:, k])) + k
         if pivot != k:
             U[[k, pivot]] = U[[pivot, k]]  # Troca linhas em U
-            P[[k, pivot]] = P[[pivot, k]]  # Troca linhas em P
+            piv[[k, pivot]] = piv[[pivot, k]]  # Troca os índices no vetor de pivôs
             if k > 0:
                 L[[k, pivot], :k] = L[[pivot, k], :k]  # Troca linhas em L
 
@@ -31,7 +32,7 @@ def decomposicao_LU_pivot(A):
             L[i, k] = U[i, k] / U[k, k]
             U[i, k:] -= L[i, k] * U[k, k:]
 
-    return P, L, U
+    return piv, L, U
 
 def resolver_sistema_LU(A, b):
     """
@@ -47,10 +48,10 @@ def resolver_sistema_LU(A, b):
     x : np.array
         Solução do sistema.
     """
-    P, L, U = decomposicao_LU_pivot(A)
+    piv, L, U = decomposicao_LU_pivot(A)
     
-    # Resolver Pb = L(Ux) = b
-    b_modificado = np.dot(P, b)
+    # Resolver Pb = L(Ux) = b (Pb é só b reordenado pelos pivôs)
+    b_modificado = np.asarray(b)[piv]
 
     # Resolução de Ly = Pb (substituição direta)
     n = len(b)
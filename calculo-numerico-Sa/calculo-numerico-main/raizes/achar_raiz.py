@@ -2,24 +2,104 @@ import math
 import numpy as np
 
 
+def avaliar_em_array(f, x):
+    """
+    Avalia f em todos os pontos do array x com uma única chamada.
+
+    Se f não aceitar arrays (ex.: usa math.log ou if), avalia ponto a ponto.
+
+    Parâmetros:
+    f (função): A função f(x).
+    x (array): Pontos onde f será avaliada.
+
+    Retorna:
+    array: Os valores f(x), com o mesmo formato de x.
+    """
+    x = np.asarray(x, dtype=float)
+    try:
+        y = np.asarray(f(x), dtype=float)
+        if y.shape == x.shape:
+            return y
+    except (TypeError, ValueError):
+        pass
+    return np.array([f(xi) for xi in x.ravel()], dtype=float).reshape(x.shape)
+
+
+def isolar_raizes(a: float, b: float, f = lambda x: ..., n_pontos: int = 1000, subdivisoes: int = 16, max_nivel: int = 6):
+    """
+    Isola as raízes de f em [a, b] amostrando f em uma malha do NumPy.
+
+    Cada intervalo da malha com mudança de sinal vira um intervalo de raiz.
+    Onde |f| tem um mínimo local sem mudança de sinal, a parábola que passa pelos
+    três pontos vizinhos é usada para decidir se pode haver um par de raízes
+    escondido ali; se puder, essa região é refinada com uma malha mais fina
+    (até max_nivel vezes). Cada nível avalia f em uma única chamada.
+
+    Parâmetros:
+    a, b (float): Limites do intervalo (não precisam ser inteiros).
+    f (função): A função f(x), de preferência vetorizada.
+    n_pontos (int): Número de subintervalos da malha inicial.
+    subdivisoes (int): Número de subintervalos usados em cada refinamento.
+    max_nivel (int): Número máximo de refinamentos.
+
+    Retorna:
+    array: Array (N, 2) com os intervalos [x_i, x_i+1] que contêm raízes, ordenados.
+    """
+    X = np.linspace(a, b, n_pontos + 1).reshape(1, -1)  # Cada linha é uma malha
+    Y = avaliar_em_array(f, X)
+    intervalos = []
+    zeros = []
+
+    for nivel in range(max_nivel + 1):
+        # Pontos onde f é exatamente zero (no nível 0 os extremos também contam)
+        inicio = 0 if nivel == 0 else 1
+        fim = Y.shape[1] if nivel == 0 else Y.shape[1] - 1
+        zeros.append(X[:, inicio:fim][Y[:, inicio:fim] == 0])
+
+        # Intervalos com mudança de sinal
+        troca = Y[:, :-1] * Y[:, 1:] < 0
+        intervalos.append(np.column_stack((X[:, :-1][troca], X[:, 1:][troca])))
+
+        if nivel == max_nivel:
+            break
+
+        # Mínimos locais de |f| sem mudança de sinal
+        y0, y1, y2 = Y[:, :-2], Y[:, 1:-1], Y[:, 2:]
+        suspeito = (y0 * y1 > 0) & (y1 * y2 > 0) & (np.abs(y1) < np.abs(y0)) & (np.abs(y1) < np.abs(y2))
+
+        # Vértice da parábola pelos três pontos: se troca de sinal, pode haver raízes
+        curvatura = y0 - 2 * y1 + y2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vertice = y1 - (y2 - y0) ** 2 / (8 * curvatura)
+        suspeito &= (curvatura != 0) & (vertice * y1 <= 0)
+
+        if not suspeito.any():
+            break
+
+        # Refina [x_i-1, x_i+1] de cada ponto suspeito com uma nova malha
+        esquerda = X[:, :-2][suspeito]
+        direita = X[:, 2:][suspeito]
+        passos = np.linspace(0, 1, subdivisoes + 1)
+        X = esquerda[:, None] + (direita - esquerda)[:, None] * passos
+        Y = avaliar_em_array(f, X)
+
+    intervalos = np.concatenate(intervalos)
+    zeros = np.unique(np.concatenate(zeros))
+    intervalos = np.concatenate((intervalos, np.column_stack((zeros, zeros))))
+    return intervalos[np.argsort(intervalos[:, 0], kind="stable")]
+
+
 # Função para verificar intervalos que podem conter raízes (pelo método da mudança de sinal)
-def hunt_root(a: float, b: float, f = lambda x: ...):
-    # Cria um objeto de polinômio usando o vetor de coeficientes fornecido
-    intervals = []
-    counter = 0  # Contador de raízes encontradas
-    
-    # Itera sobre os inteiros dentro do intervalo [a, b]
-    for x in range(a, b + 1):
-        # Verifica se o produto das funções em pontos consecutivos muda de sinal
-        # Se f(x) * f(x + 1) < 0, significa que há uma mudança de sinal, indicando que há uma raiz entre x e x+1
-        if f(x) * f(x + 1) < 0:
-            # print(f"Tem raiz no intervalo [{x}, {x + 1}]")  # Imprime que há uma raiz no intervalo
-            intervals.append((x, x+1))
-            counter += 1  # Incrementa o contador de raízes encontradas
-            # print(f"Não tem raiz no intervalo [{x}, {x + 1}]")  # Imprime que não há raiz no intervalo
+def hunt_root(a: float, b: float, f = lambda x: ..., n_pontos: int = None):
+    # Por padrão usa uma malha com passo 0.1, refinada onde houver indício de raízes escondidas
+    if n_pontos is None:
+        n_pontos = max(int(math.ceil(10 * (b - a))), 1)
+
+    intervals = [tuple(intervalo) for intervalo in isolar_raizes(a, b, f, n_pontos).tolist()]
+    counter = len(intervals)  # Contador de raízes encontradas
 
     print(f"Há {counter} raizes no intervalo [{a}, {b}]")
-    return intervals  # Retorna o número de raízes encontradas no intervalo
+    return intervals  # Retorna os intervalos que contêm raízes
 
 
 import numpy as np
@@ -0,0 +1,82 @@
+from collections import OrderedDict
+
+import numpy as np
+
+
+class OrcamentoEsgotado(RuntimeError):
+    """Levantada quando a função passa do número máximo de avaliações permitido."""
+
+
+class FuncaoContada:
+    """
+    Envolve uma função f(x) guardando os últimos pares (x, f(x)) e contando as chamadas.
+
+    O objeto é chamado exatamente como f, então pode ser passado no lugar de f
+    para qualquer método de raizes/ (bissection, position_falsi, secant,
+    newton_raphson, brent, ...) sem mudar o algoritmo. Chamadas repetidas no mesmo
+    x são respondidas pelo cache, sem avaliar f de novo. Chamadas com arrays não
+    passam pelo cache, mas cada elemento conta como uma avaliação.
+
+    Parâmetros:
+    f (função): A função f(x) original.
+    tamanho_cache (int): Quantos pares (x, f(x)) recentes são guardados.
+    orcamento (int): Número máximo de avaliações de f (None para não limitar).
+    """
+
+    def __init__(self, f, tamanho_cache: int = 16, orcamento: int = None):
+        self.f = f
+        self.tamanho_cache = tamanho_cache
+        self.orcamento = orcamento
+        self.cache = OrderedDict()
+        self.chamadas = 0  # Vezes que o objeto foi chamado
+        self.avaliacoes = 0  # Vezes que f foi realmente avaliada (por elemento)
+        self.acertos = 0  # Chamadas respondidas pelo cache
+
+    def __call__(self, x):
+        self.chamadas += 1
+
+        if np.ndim(x) > 0:
+            n = np.size(x)
+            self.verificar_orcamento(n)
+            y = self.f(x)
+            self.avaliacoes += n
+            return y
+
+        if x in self.cache:
+            self.acertos += 1
+            self.cache.move_to_end(x)
+            return self.cache[x]
+
+        self.verificar_orcamento(1)
+        y = self.f(x)
+        self.avaliacoes += 1
+        self.cache[x] = y
+        if len(self.cache) > self.tamanho_cache:
+            self.cache.popitem(last=False)  # Descarta o par usado há mais tempo
+        return y
+
+    def verificar_orcamento(self, n: int):
+        if self.orcamento is not None and self.avaliacoes + n > self.orcamento:
+            raise OrcamentoEsgotado(f"Orçamento de {self.orcamento} avaliações de f esgotado.")
+
+    def zerar(self):
+        """Limpa o cache e os contadores (o orçamento volta a ficar disponível)."""
+        self.cache.clear()
+        self.chamadas = 0
+        self.avaliacoes = 0
+        self.acertos = 0
+
+
+# EXEMPLO DE USO
+
+# import math
+# from achar_raiz import hunt_root
+# from secante import secant
+
+# f = FuncaoContada(lambda x: (x**math.log(x)) + x**2 + x**3 * math.sin(x), orcamento=10000)
+# intervalos = hunt_root(1, 20, f)
+
+# for a, b in intervalos:
+#     raiz = secant(a, b, 1000, 0.00001, f)
+#     print(f"A raiz encontrada no intervalo [{a},{b}] é: {raiz}")
+# print(f"Chamadas: {f.chamadas}, avaliações: {f.avaliacoes}, respondidas pelo cache: {f.acertos}")
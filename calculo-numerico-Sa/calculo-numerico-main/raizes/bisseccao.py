@@ -1,4 +1,5 @@
 import math
+import numpy as np
 from achar_raiz import hunt_root
 
 
@@ -19,6 +20,53 @@ def bissection(a: float, b: float, max_iter: int, error: float, f = lambda x: ..
     return midpoint
 
 
+def bissection_batch(intervalos, max_iter: int, error: float, f = lambda x: ...):
+    """
+    Aplica a bisseção em vários intervalos ao mesmo tempo usando arrays do NumPy.
+
+    Parâmetros:
+    intervalos (array): Array (N, 2) com os intervalos [a, b] (ex.: a saída do hunt_root).
+    max_iter (int): Número máximo de iterações.
+    error (float): Tolerância para |f(ponto médio)|.
+    f (função): Função vetorizada, ou seja, que aceita e retorna arrays.
+
+    Retorna:
+    tuple: (raizes, convergiu), dois arrays de tamanho N. convergiu[i] é True
+    se o intervalo i atingiu a tolerância antes de max_iter.
+    """
+    intervalos = np.asarray(intervalos, dtype=float).reshape(-1, 2)
+    a = intervalos[:, 0].copy()
+    b = intervalos[:, 1].copy()
+
+    # f(a) é guardado e atualizado junto com a, então cada iteração só avalia f nos pontos médios
+    fa = np.asarray(f(a), dtype=float)
+    midpoint = (a + b) / 2
+    convergiu = np.zeros(len(a), dtype=bool)
+    ativos = np.arange(len(a))  # Índices dos intervalos que ainda não convergiram
+
+    for _ in range(max_iter):
+        if ativos.size == 0:
+            break
+
+        m = (a[ativos] + b[ativos]) / 2
+        fm = np.asarray(f(m), dtype=float)  # Uma única chamada de f para todos os intervalos ativos
+        midpoint[ativos] = m
+
+        check_signal = fa[ativos] * fm
+        esquerda = check_signal < 0
+        direita = check_signal > 0
+        b[ativos[esquerda]] = m[esquerda]
+        a[ativos[direita]] = m[direita]
+        fa[ativos[direita]] = fm[direita]
+
+        # Remove do conjunto ativo os intervalos que já convergiram
+        terminou = (check_signal == 0) | (np.abs(fm) < error)
+        convergiu[ativos[terminou]] = True
+        ativos = ativos[~terminou]
+
+    return midpoint, convergiu
+
+
 # EXEMPLO DE USO
 
 # f = lambda x: (x**math.log(x)) + x**2 + x**3 * math.sin(x)
@@ -26,4 +74,13 @@ def bissection(a: float, b: float, max_iter: int, error: float, f = lambda x: ..
 
 # for a, b in intervalos:
 #     raiz = bissection(a, b, 1000, 0.00001, f)
-#     print(f"A raiz encontrada no intervalo [{a},{b}] é: {raiz}")
\ No newline at end of file
+#     print(f"A raiz encontrada no intervalo [{a},{b}] é: {raiz}")
+
+# EXEMPLO DE USO (LOTE)
+
+# f_vet = lambda x: (x**np.log(x)) + x**2 + x**3 * np.sin(x)
+# intervalos = hunt_root(1, 20, f)
+
+# raizes, convergiu = bissection_batch(intervalos, 1000, 0.00001, f_vet)
+# for (a, b), raiz, ok in zip(intervalos, raizes, convergiu):
+#     print(f"A raiz encontrada no intervalo [{a},{b}] é: {raiz} (convergiu: {ok})")
@@ -0,0 +1,80 @@
+import asyncio
+import inspect
+
+
+async def avaliar(f, x: float, semaforo: asyncio.Semaphore = None):
+    """Avalia f(x) aceitando tanto funções comuns quanto corrotinas (async def)."""
+    if semaforo is None:
+        resultado = f(x)
+        return await resultado if inspect.isawaitable(resultado) else resultado
+    async with semaforo:
+        resultado = f(x)
+        return await resultado if inspect.isawaitable(resultado) else resultado
+
+
+async def kseccao(a: float, b: float, max_iter: int, error: float, f = lambda x: ..., k: int = 4,
+                  concorrencia: int = None):
+    """
+    Bisseção generalizada (k-seção) para funções lentas de avaliar, como resultados
+    buscados em um serviço de simulação.
+
+    Em cada rodada os k - 1 pontos internos do intervalo são avaliados ao mesmo tempo
+    (asyncio.gather) e o intervalo encolhe k vezes, mantendo a mudança de sinal
+    como na bisseção. Com k = 2 é a bisseção comum; com k = 8 cada rodada equivale
+    a 3 iterações da bisseção pelo tempo de espera de uma.
+
+    Parâmetros:
+    a, b (float): Intervalo onde está a raiz (f(a) e f(b) com sinais opostos).
+    max_iter (int): Número máximo de rodadas.
+    error (float): Tolerância para |f(x)| e para a metade do tamanho do intervalo.
+    f (função): f(x) comum ou corrotina (async def f(x)).
+    k (int): Em quantas partes o intervalo é dividido por rodada.
+    concorrencia (int): Máximo de avaliações de f em andamento ao mesmo tempo (padrão: k - 1).
+
+    Retorna:
+    float: A aproximação da raiz.
+    """
+    if k < 2:
+        raise ValueError("k deve ser pelo menos 2.")
+    semaforo = asyncio.Semaphore(concorrencia or k - 1)
+
+    fa, fb = await asyncio.gather(avaliar(f, a, semaforo), avaliar(f, b, semaforo))
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+    if fa * fb > 0:
+        raise ValueError("Palpites iniciais incorretos. As raízes não estão contidas no intervalo fornecido.")
+
+    for _ in range(max_iter):
+        pontos = [a + (b - a) * i / k for i in range(1, k)]
+        valores = await asyncio.gather(*(avaliar(f, x, semaforo) for x in pontos))
+
+        for x, fx in zip(pontos, valores):
+            if abs(fx) < error:
+                return x
+
+        # Primeiro subintervalo em que o sinal muda
+        extremos = [a] + pontos + [b]
+        sinais = [fa] + list(valores) + [fb]
+        for i in range(k):
+            if sinais[i] * sinais[i + 1] < 0:
+                a, b = extremos[i], extremos[i + 1]
+                fa, fb = sinais[i], sinais[i + 1]
+                break
+
+        if (b - a) / 2 < error:
+            break
+
+    return (a + b) / 2
+
+
+# EXEMPLO DE USO
+
+# async def f(x):
+#     await asyncio.sleep(0.01)  # Simula a espera por um serviço de simulação
+#     return x**3 - 2*x - 5
+
+# for k in (2, 4, 8):
+#     raiz = asyncio.run(kseccao(2, 3, 1000, 1e-10, f, k=k))
+#     print(f"k = {k}: a raiz encontrada no intervalo [2,3] é: {raiz}")
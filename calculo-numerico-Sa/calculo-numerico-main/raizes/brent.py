@@ -0,0 +1,96 @@
+import math
+import sys
+from achar_raiz import hunt_root
+
+
+def brent(a: float, b: float, max_iter: int, e: float, f = lambda x: ...):
+    """
+    Método de Brent: combina bisseção, secante e interpolação quadrática inversa.
+
+    A raiz fica sempre dentro de um intervalo com mudança de sinal (como na
+    bisseção), mas quando a interpolação dá um passo confiável ele é usado no
+    lugar do ponto médio, o que dá convergência superlinear. Cada iteração avalia
+    f uma única vez.
+
+    Parâmetros:
+    a, b (float): Intervalo onde está a raiz (f(a) e f(b) com sinais opostos).
+    max_iter (int): Número máximo de iterações.
+    e (float): Tolerância para o tamanho do intervalo.
+    f (função): A função f(x).
+
+    Retorna:
+    float: A aproximação da raiz.
+    """
+    fa = f(a)
+    fb = f(b)
+
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+    if fa * fb > 0:
+        raise ValueError("Palpites iniciais incorretos. As raízes não estão contidas no intervalo fornecido.")
+
+    # c é o extremo oposto a b (a raiz está entre b e c), a é a aproximação anterior
+    c, fc = a, fa
+    d = passo_anterior = b - a
+
+    for _ in range(max_iter):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = passo_anterior = b - a
+
+        # Mantém b como a melhor aproximação
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol = 2 * sys.float_info.epsilon * abs(b) + e / 2
+        m = (c - b) / 2
+
+        if abs(m) <= tol or fb == 0:
+            return b
+
+        if abs(passo_anterior) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secante
+                p = 2 * m * s
+                q = 1 - s
+            else:
+                # Interpolação quadrática inversa
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+
+            # Só aceita a interpolação se ela cair dentro do intervalo e encolher o passo
+            if 2 * p < min(3 * m * q - abs(tol * q), abs(passo_anterior * q)):
+                passo_anterior = d
+                d = p / q
+            else:
+                d = passo_anterior = m
+        else:
+            # Bisseção
+            d = passo_anterior = m
+
+        a, fa = b, fb
+        b += d if abs(d) > tol else math.copysign(tol, m)
+        fb = f(b)
+
+    return b
+
+
+# EXEMPLO DE USO
+
+# f = lambda x: (x**math.log(x)) + x**2 + x**3 * math.sin(x)
+# intervalos = hunt_root(1, 20, f)
+
+# for a, b in intervalos:
+#     raiz = brent(a, b, 1000, 0.00001, f)
+#     print(f"A raiz encontrada no intervalo [{a},{b}] é: {raiz}")
@@ -0,0 +1,147 @@
+import numpy as np
+from achar_raiz import avaliar_em_array
+from dual import valor_e_derivada
+
+
+def pontos_chebyshev(n: int, a: float = -1.0, b: float = 1.0):
+    """Os n + 1 pontos de Chebyshev x_j = cos(jπ/n) levados para [a, b] (de b para a)."""
+    x = np.cos(np.pi * np.arange(n + 1) / n)
+    return (a + b) / 2 + (b - a) / 2 * x
+
+
+def coeficientes_chebyshev(valores):
+    """
+    Coeficientes c_k do interpolante sum c_k·T_k(x) a partir dos valores nos pontos
+    de Chebyshev (em ordem j = 0..n), com uma FFT.
+    """
+    valores = np.asarray(valores, dtype=float)
+    n = len(valores) - 1
+    if n == 0:
+        return valores.copy()
+    estendido = np.concatenate((valores, valores[n - 1:0:-1]))
+    c = np.real(np.fft.fft(estendido))[:n + 1] / n
+    c[0] /= 2
+    c[n] /= 2
+    return c
+
+
+def matriz_colega(c):
+    """Matriz colega da série de Chebyshev (os autovalores são as raízes), análoga à matriz companheira."""
+    n = len(c) - 1
+    if n == 1:
+        return np.array([[-c[0] / c[1]]])
+    M = np.zeros((n, n))
+    M[0, 1] = 1.0
+    indices = np.arange(1, n)
+    M[indices, indices - 1] = 0.5
+    M[indices[:-1], indices[:-1] + 1] = 0.5
+    M[-1, :] -= c[:-1] / (2 * c[-1])
+    return M
+
+
+def raizes_serie_chebyshev(c, tol: float = 1e-8):
+    """Raízes reais em [-1, 1] da série sum c_k·T_k(x)."""
+    # Descarta a cauda desprezível antes de montar a matriz (evita raízes espúrias)
+    significativos = np.flatnonzero(np.abs(c) > 1e-13 * np.abs(c).max())
+    if significativos.size == 0 or significativos[-1] == 0:
+        return np.zeros(0)
+    c = c[:significativos[-1] + 1]
+
+    raizes = np.linalg.eigvals(matriz_colega(c))
+    reais = (np.abs(raizes.imag) <= tol) & (np.abs(raizes.real) <= 1 + tol)
+    return np.sort(np.clip(raizes[reais].real, -1, 1))
+
+
+def raizes_chebyshev(f, a: float, b: float, tol: float = 1e-13, grau_inicial: int = 16, grau_max: int = 128,
+                     passos_newton: int = 2, nivel_max: int = 12):
+    """
+    Encontra todas as raízes de uma função suave em [a, b] por meio de um interpolante de Chebyshev.
+
+    Em cada subintervalo f é amostrada nos pontos de Chebyshev com uma única chamada
+    vetorizada; o grau dobra (reaproveitando os pontos já avaliados) até os últimos
+    coeficientes ficarem abaixo de tol. Se nem o grau máximo resolve f, o intervalo
+    é dividido ao meio. As raízes do interpolante saem dos autovalores da matriz
+    colega e depois recebem alguns passos de Newton na própria f (derivada por
+    números duais).
+
+    Uma raiz dupla do interpolante só é determinada até ~sqrt(tol) (os autovalores
+    saem como um par quase real). Por isso autovalores com parte imaginária até
+    sqrt(tol) são aceitos, e raízes a menos de sqrt(tol)·(b - a) umas das outras
+    são juntadas em uma só: raízes múltiplas aparecem uma única vez na saída.
+
+    Parâmetros:
+    f (função): A função f(x), escrita com operadores e funções do NumPy.
+    a, b (float): O intervalo de busca.
+    tol (float): Tolerância relativa para a cauda dos coeficientes.
+    grau_inicial, grau_max (int): Grau inicial e máximo do interpolante em cada subintervalo.
+    passos_newton (int): Passos de Newton aplicados em cada raiz no final.
+    nivel_max (int): Número máximo de divisões sucessivas de um intervalo.
+
+    Retorna:
+    tuple: (raízes distintas em ordem crescente, número de avaliações de f).
+    """
+    raizes = []
+    avaliacoes = 0
+    pilha = [(a, b, 0)]
+
+    while pilha:
+        inicio, fim, nivel = pilha.pop()
+
+        n = grau_inicial
+        valores = avaliar_em_array(f, pontos_chebyshev(n, inicio, fim))
+        avaliacoes += n + 1
+        while True:
+            c = coeficientes_chebyshev(valores)
+            escala = max(np.abs(valores).max(), 1e-300)
+            resolvido = np.all(np.abs(c[-3:]) <= tol * escala)
+            if resolvido or 2 * n > grau_max:
+                break
+            # Os pontos de grau n são os de índice par no grau 2n: só avalia os ímpares
+            novos = avaliar_em_array(f, pontos_chebyshev(2 * n, inicio, fim)[1::2])
+            avaliacoes += n
+            intercalados = np.empty(2 * n + 1)
+            intercalados[::2] = valores
+            intercalados[1::2] = novos
+            valores = intercalados
+            n *= 2
+
+        if not resolvido and nivel < nivel_max:
+            # Divide um pouco fora do meio para não cair em simetrias de f
+            meio = inicio + (fim - inicio) * 0.4951501650824745
+            pilha.append((meio, fim, nivel + 1))
+            pilha.append((inicio, meio, nivel + 1))
+            continue
+
+        t = raizes_serie_chebyshev(c, np.sqrt(tol))
+        raizes.append((inicio + fim) / 2 + (fim - inicio) / 2 * t)
+
+    raizes = np.sort(np.concatenate(raizes)) if raizes else np.zeros(0)
+
+    # Polimento na f original, todas as raízes de uma vez
+    for _ in range(passos_newton):
+        if raizes.size == 0:
+            break
+        fx, dfx = valor_e_derivada(f, raizes)
+        avaliacoes += raizes.size
+        with np.errstate(divide="ignore", invalid="ignore"):
+            passo = np.where(dfx != 0, fx / dfx, 0.0)
+        passo[~np.isfinite(passo)] = 0
+        raizes = np.clip(raizes - passo, a, b)
+
+    # O polimento pode trocar a ordem de raízes vizinhas
+    raizes = np.sort(raizes)
+
+    # Junta as raízes próximas (raízes múltiplas e as da fronteira entre subintervalos,
+    # que aparecem duas vezes), ficando com a média de cada grupo
+    if raizes.size > 1:
+        novo_grupo = np.diff(raizes) > np.sqrt(tol) * (b - a)
+        grupos = np.concatenate(([0], np.cumsum(novo_grupo)))
+        raizes = np.bincount(grupos, weights=raizes) / np.bincount(grupos)
+    return raizes, avaliacoes
+
+
+# EXEMPLO DE USO
+
+# f = lambda x: (x**np.log(x)) + x**2 + x**3 * np.sin(x)
+# raizes, avaliacoes = raizes_chebyshev(f, 1, 20)
+# print(f"Raízes: {raizes} ({avaliacoes} avaliações de f)")
@@ -0,0 +1,136 @@
+import math
+import numpy as np
+from dual import valor_e_derivada
+
+
+def corretor_newton(f, x: float, p: float, e: float, max_iter: int):
+    """
+    Newton em x com o parâmetro p fixo (f'(x) exato por números duais).
+
+    Retorna:
+    tuple: (x, f_x no último iterado, iterações, convergiu).
+    """
+    dfx = math.nan
+    for k in range(1, max_iter + 1):
+        fx, dfx = valor_e_derivada(lambda x: f(x, p), x)
+        if dfx == 0 or not math.isfinite(fx) or not math.isfinite(dfx):
+            return x, dfx, k, False
+        passo = fx / dfx
+        x = x - passo
+        if abs(passo) <= e * (1 + abs(x)):
+            return x, dfx, k, True
+    return x, dfx, max_iter, False
+
+
+def continuacao(f, x0: float, parametros, e: float = 1e-10, preditor: str = "tangente",
+                max_iter_corretor: int = 8, passo_min: float = None):
+    """
+    Acompanha a raiz x(p) de f(x, p) = 0 ao longo de uma sequência de parâmetros.
+
+    Em vez de recomeçar do zero para cada p, a próxima raiz é prevista a partir
+    das anteriores e só depois corrigida com Newton:
+    - preditor "tangente": x + h·dx/dp, com dx/dp = -f_p / f_x (números duais);
+    - preditor "secante": extrapolação linear pelos dois últimos pontos.
+    O passo em p é adaptativo: dobra quando o corretor converge em até 2
+    iterações e cai pela metade quando ele falha. Se o passo fica menor que
+    passo_min, a curva tem um ponto de retorno (dobra) ali: ele é registrado e
+    a busca recomeça com Newton comum no próximo p (que pode achar outro ramo).
+
+    Parâmetros:
+    f (função): A função f(x, p), escrita com operadores e funções do NumPy.
+    x0 (float): Chute para a raiz em parametros[0].
+    parametros (list): Os valores de p, em ordem crescente ou decrescente.
+    e (float): Tolerância relativa do passo de Newton.
+    preditor (str): "tangente" ou "secante".
+    max_iter_corretor (int): Iterações de Newton permitidas por passo.
+    passo_min (float): Menor passo em p (padrão: 1e-9 vezes o comprimento da faixa).
+
+    Retorna:
+    tuple: (raízes para cada p, com nan onde falhou; iterações de Newton gastas
+    em cada p; lista de pontos de retorno (p, x)).
+    """
+    if preditor not in ("tangente", "secante"):
+        raise ValueError("Preditor inválido. Escolha entre 'tangente' ou 'secante'.")
+
+    parametros = np.asarray(parametros, dtype=float)
+    n = len(parametros)
+    raizes = np.full(n, np.nan)
+    iteracoes = np.zeros(n, dtype=int)
+    pontos_de_retorno = []
+    if n == 0:
+        return raizes, iteracoes, pontos_de_retorno
+
+    if passo_min is None:
+        passo_min = 1e-9 * max(abs(parametros[-1] - parametros[0]), 1e-300)
+
+    x, dfx, iteracoes[0], convergiu = corretor_newton(f, x0, parametros[0], e, 100)
+    if not convergiu:
+        raise ValueError(f"Newton não convergiu para a raiz inicial em p = {parametros[0]}.")
+    raizes[0] = x
+    p = parametros[0]
+    anterior = None  # (p, x) aceito antes do atual, para o preditor secante
+    h = parametros[1] - parametros[0] if n > 1 else 0.0
+
+    for i in range(1, n):
+        alvo = parametros[i]
+        sentido = math.copysign(1.0, alvo - p)
+        gasto = 0
+
+        while p != alvo:
+            h = sentido * min(abs(h), abs(alvo - p))
+            p_novo = alvo if abs(alvo - (p + h)) <= passo_min else p + h
+
+            if preditor == "secante" and anterior is not None:
+                x_previsto = x + (p_novo - p) * (x - anterior[1]) / (p - anterior[0])
+            else:
+                fp = valor_e_derivada(lambda q: f(x, q), p)[1]
+                x_previsto = x - (p_novo - p) * fp / dfx
+
+            x_novo, dfx_novo, k, convergiu = corretor_newton(f, x_previsto, p_novo, e, max_iter_corretor)
+            gasto += k
+
+            # Rejeita o passo se Newton pulou para outro ramo: f_x mudou de sinal
+            # (cruzou uma dobra) ou a correção foi grande demais para o passo dado
+            aceito = (convergiu and dfx_novo * dfx > 0
+                      and abs(x_novo - x_previsto) <= abs(x_previsto - x) + abs(p_novo - p))
+
+            if aceito:
+                anterior = (p, x)
+                p, x, dfx = p_novo, x_novo, dfx_novo
+                if k <= 2:
+                    h *= 2
+            else:
+                h /= 2
+                if abs(h) < passo_min:
+                    break
+
+        if p == alvo:
+            raizes[i] = x
+        else:
+            # Ponto de retorno: o ramo atual acaba antes de alvo
+            if not pontos_de_retorno or pontos_de_retorno[-1] != (p, x):
+                pontos_de_retorno.append((p, x))
+            x_frio, dfx_frio, k, convergiu = corretor_newton(f, x, alvo, e, 100)
+            gasto += k
+            if convergiu:
+                p, x, dfx, anterior = alvo, x_frio, dfx_frio, None
+                raizes[i] = x
+            h = alvo - parametros[i - 1]
+
+        iteracoes[i] = gasto
+
+    return raizes, iteracoes, pontos_de_retorno
+
+
+# EXEMPLO DE USO
+
+# # Raiz de x^3 - x - p para p de -1 a 1: o ramo de baixo tem uma dobra em p = 2/(3√3)
+# f = lambda x, p: x**3 - x - p
+# parametros = np.linspace(-1, 1, 2001)
+# raizes, iteracoes, pontos_de_retorno = continuacao(f, -1.3, parametros)
+# print(f"Iterações por p: {iteracoes[1:].mean():.2f} (máximo {iteracoes.max()})")
+# print("Pontos de retorno (p, x):", pontos_de_retorno)
+
+# # Família do achar_raiz.py com um parâmetro multiplicando o seno
+# g = lambda x, p: (x**np.log(x)) + x**2 + p * x**3 * np.sin(x)
+# raizes, iteracoes, _ = continuacao(g, 3.5459, np.linspace(1, 2, 1001), preditor="secante")
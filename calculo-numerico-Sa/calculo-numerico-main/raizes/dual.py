@@ -0,0 +1,252 @@
+import numpy as np
+
+
+class Dual:
+    """
+    Número dual a + b·ε (com ε² = 0) para derivação automática (modo direto).
+
+    Avaliar f em Dual(x, 1) devolve Dual(f(x), f'(x)), ou seja, o valor e a
+    derivada exata em uma única passada. Funciona com os operadores do Python e
+    com as ufuncs do NumPy (np.sin, np.exp, np.log, ...). As funções do módulo
+    math não aceitam Dual; use as do NumPy ou as deste arquivo (sin, exp, ...).
+    O valor pode ser um float, um array ou outro Dual (derivadas de ordem maior).
+
+    Parâmetros:
+    valor: A parte real (f(x)).
+    derivada: A parte dual (f'(x)).
+    """
+
+    __array_priority__ = 1000
+
+    def __init__(self, valor, derivada=0.0):
+        self.valor = valor
+        self.derivada = derivada
+
+    def __repr__(self):
+        return f"Dual({self.valor!r}, {self.derivada!r})"
+
+    # Operações aritméticas
+    def __add__(self, outro):
+        outro = como_dual(outro)
+        return Dual(self.valor + outro.valor, self.derivada + outro.derivada)
+
+    def __radd__(self, outro):
+        return como_dual(outro) + self
+
+    def __sub__(self, outro):
+        outro = como_dual(outro)
+        return Dual(self.valor - outro.valor, self.derivada - outro.derivada)
+
+    def __rsub__(self, outro):
+        return como_dual(outro) - self
+
+    def __mul__(self, outro):
+        outro = como_dual(outro)
+        return Dual(self.valor * outro.valor, self.valor * outro.derivada + self.derivada * outro.valor)
+
+    def __rmul__(self, outro):
+        return como_dual(outro) * self
+
+    def __truediv__(self, outro):
+        outro = como_dual(outro)
+        return Dual(self.valor / outro.valor,
+                    (self.derivada * outro.valor - self.valor * outro.derivada) / (outro.valor * outro.valor))
+
+    def __rtruediv__(self, outro):
+        return como_dual(outro) / self
+
+    def __pow__(self, expoente):
+        if isinstance(expoente, Dual):
+            # x^g = exp(g·ln(x))
+            return np.exp(expoente * np.log(self))
+        return Dual(self.valor ** expoente, expoente * self.valor ** (expoente - 1) * self.derivada)
+
+    def __rpow__(self, base):
+        # c^g = c^g · ln(c) · g'
+        resultado = base ** self.valor
+        return Dual(resultado, resultado * np.log(base) * self.derivada)
+
+    def __neg__(self):
+        return Dual(-self.valor, -self.derivada)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return Dual(abs(self.valor), np.sign(parte_real(self.valor)) * self.derivada)
+
+    # Comparações usam só o valor (permite "if x > 0" dentro de f)
+    def __lt__(self, outro):
+        return parte_real(self) < parte_real(outro)
+
+    def __le__(self, outro):
+        return parte_real(self) <= parte_real(outro)
+
+    def __gt__(self, outro):
+        return parte_real(self) > parte_real(outro)
+
+    def __ge__(self, outro):
+        return parte_real(self) >= parte_real(outro)
+
+    def __array_ufunc__(self, ufunc, method, *entradas, **kwargs):
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        if ufunc is np.power:
+            # Expoente constante usa a regra n·x^(n-1)·x', como em x**n (exp(n·ln x) daria nan para x < 0)
+            base, expoente = entradas
+            return base ** expoente if isinstance(base, Dual) else expoente.__rpow__(base)
+
+        if ufunc in OPERADORES:
+            a, b = (como_dual(x) for x in entradas)
+            return OPERADORES[ufunc](a, b)
+
+        if ufunc in DERIVADAS and len(entradas) == 1:
+            x = entradas[0]
+            return Dual(ufunc(x.valor), DERIVADAS[ufunc](x.valor) * x.derivada)
+
+        return NotImplemented
+
+
+def como_dual(x):
+    return x if isinstance(x, Dual) else Dual(x, 0.0)
+
+
+def parte_real(x):
+    while isinstance(x, Dual):
+        x = x.valor
+    return x
+
+
+OPERADORES = {
+    np.add: Dual.__add__,
+    np.subtract: Dual.__sub__,
+    np.multiply: Dual.__mul__,
+    np.true_divide: Dual.__truediv__,
+}
+
+# Derivada de cada ufunc de um argumento, em função do valor
+DERIVADAS = {
+    np.negative: lambda v: -1.0,
+    np.sin: lambda v: np.cos(v),
+    np.cos: lambda v: -np.sin(v),
+    np.tan: lambda v: 1 / np.cos(v) ** 2,
+    np.arcsin: lambda v: 1 / np.sqrt(1 - v * v),
+    np.arccos: lambda v: -1 / np.sqrt(1 - v * v),
+    np.arctan: lambda v: 1 / (1 + v * v),
+    np.sinh: lambda v: np.cosh(v),
+    np.cosh: lambda v: np.sinh(v),
+    np.tanh: lambda v: 1 / np.cosh(v) ** 2,
+    np.exp: lambda v: np.exp(v),
+    np.log: lambda v: 1 / v,
+    np.log2: lambda v: 1 / (v * np.log(2)),
+    np.log10: lambda v: 1 / (v * np.log(10)),
+    np.sqrt: lambda v: 1 / (2 * np.sqrt(v)),
+    np.square: lambda v: 2 * v,
+    np.absolute: lambda v: np.sign(parte_real(v)),
+}
+
+
+# Equivalentes das funções do módulo math que aceitam Dual
+def sin(x): return np.sin(x)
+def cos(x): return np.cos(x)
+def tan(x): return np.tan(x)
+def asin(x): return np.arcsin(x)
+def acos(x): return np.arccos(x)
+def atan(x): return np.arctan(x)
+def sinh(x): return np.sinh(x)
+def cosh(x): return np.cosh(x)
+def tanh(x): return np.tanh(x)
+def exp(x): return np.exp(x)
+def sqrt(x): return np.sqrt(x)
+
+
+def log(x, base=None):
+    if base is None:
+        return np.log(x)
+    return np.log(x) / np.log(base)
+
+
+def valor_e_derivada(f, x):
+    """
+    Calcula f(x) e f'(x) exatos em uma única avaliação de f.
+
+    Parâmetros:
+    f (função): A função f(x), escrita com operadores do Python e funções do NumPy.
+    x (float ou array): O ponto (ou pontos) de avaliação.
+
+    Retorna:
+    tuple: (f(x), f'(x)).
+    """
+    y = f(Dual(x, 1.0))
+    if not isinstance(y, Dual):
+        return y, 0.0 * x  # f constante
+    return y.valor, y.derivada
+
+
+def derivada(f):
+    """Devolve a função f'(x), calculada por derivação automática."""
+    return lambda x: valor_e_derivada(f, x)[1]
+
+
+def derivadas(f, x, ordem: int = 2):
+    """
+    Calcula [f(x), f'(x), ..., f^(ordem)(x)] com números duais aninhados.
+
+    Parâmetros:
+    f (função): A função f(x).
+    x (float ou array): O ponto de avaliação.
+    ordem (int): A maior ordem de derivada desejada.
+
+    Retorna:
+    list: As derivadas de ordem 0 até ordem.
+    """
+    variavel = x
+    for _ in range(ordem):
+        variavel = Dual(variavel, 1.0)
+
+    y = f(variavel)
+    resultado = []
+    for k in range(ordem + 1):
+        # A derivada de ordem k está em .derivada aplicado k vezes seguido de .valor
+        componente = y
+        for _ in range(k):
+            componente = componente.derivada if isinstance(componente, Dual) else 0.0 * parte_real(componente)
+        resultado.append(parte_real(componente))
+    return resultado
+
+
+def jacobiana(F, x):
+    """
+    Calcula F(x) e a matriz jacobiana exata de F em x.
+
+    Cada coluna j é obtida avaliando F com a variável x_j como número dual.
+
+    Parâmetros:
+    F (função): Função que recebe a lista x e devolve a lista [f1(x), ..., fm(x)].
+    x (list): O ponto de avaliação.
+
+    Retorna:
+    tuple: (F(x), J) como arrays do NumPy.
+    """
+    x = [float(xi) for xi in x]
+    n = len(x)
+    colunas = []
+    valores = None
+
+    for j in range(n):
+        ponto = [Dual(xi, 1.0 if i == j else 0.0) for i, xi in enumerate(x)]
+        saida = [como_dual(fi) for fi in F(ponto)]
+        if valores is None:
+            valores = np.array([fi.valor for fi in saida], dtype=float)
+        colunas.append([fi.derivada for fi in saida])
+
+    return valores, np.array(colunas, dtype=float).T
+
+
+# EXEMPLO DE USO
+
+# f = lambda x: (x**np.log(x)) + x**2 + x**3 * np.sin(x)
+# valor, deriv = valor_e_derivada(f, 3.5)
+# print(f"f(3.5) = {valor}, f'(3.5) = {deriv}")
+# print(derivadas(f, 3.5, ordem=3))
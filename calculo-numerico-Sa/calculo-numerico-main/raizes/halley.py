@@ -0,0 +1,155 @@
+import math
+import numpy as np
+from achar_raiz import hunt_root
+from dual import derivadas, valor_e_derivada
+
+
+def ordem_convergencia(iterados: list):
+    """
+    Estima a ordem de convergência empírica a partir dos iterados x_0, x_1, ...
+
+    Com e_k = |x_k+1 - x_k|, a ordem é q ≈ log(e_k+1 / e_k) / log(e_k / e_k-1).
+    Devolve a última estimativa válida (nan se houver poucos iterados acima do
+    erro de arredondamento).
+
+    Parâmetros:
+    iterados (list): Os iterados do método, em ordem.
+
+    Retorna:
+    float: A ordem estimada (≈1 linear, ≈2 quadrática, ≈3 cúbica...).
+    """
+    iterados = np.asarray(iterados, dtype=float)
+    erros = np.abs(np.diff(iterados))
+    # Passos no nível do erro de arredondamento não dizem nada sobre a ordem
+    erros = erros[erros > 1e3 * np.finfo(float).eps * max(abs(iterados[-1]), 1)]
+    if erros.size < 3:
+        return float("nan")
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        logs = np.log(erros)
+        ordens = (logs[2:] - logs[1:-1]) / (logs[1:-1] - logs[:-2])
+    ordens = ordens[np.isfinite(ordens)]
+    return float(ordens[-1]) if ordens.size else float("nan")
+
+
+def halley(x0: float, max_iter: int, e: float, f = lambda x: ..., derivative = None, second_derivative = None,
+           diferencas_finitas: bool = False, h: float = 1e-4):
+    """
+    Método de Halley (convergência cúbica): x1 = x0 - 2·f·f' / (2·f'^2 - f·f'').
+
+    As derivadas vêm de derivative/second_derivative quando fornecidas; as que
+    faltarem saem de diferenças finitas centrais (diferencas_finitas=True) ou de
+    números duais.
+
+    Parâmetros:
+    x0 (float): Chute inicial.
+    max_iter (int): Número máximo de iterações.
+    e (float): Tolerância para |f(x)| e para |x1 - x0|.
+    f (função): A função f(x).
+    derivative, second_derivative (função): f'(x) e f''(x) (opcionais).
+    diferencas_finitas (bool): Usa diferenças finitas em vez de números duais.
+    h (float): Passo das diferenças finitas.
+
+    Retorna:
+    tuple: (raiz, ordem de convergência estimada, nan se o método parou com poucos
+    iterados acima do erro de arredondamento para estimá-la).
+    """
+    if derivative is not None and second_derivative is not None:
+        avaliar = lambda x: (f(x), derivative(x), second_derivative(x))
+    elif derivative is not None and diferencas_finitas:
+        avaliar = lambda x: (f(x), derivative(x), (derivative(x + h) - derivative(x - h)) / (2 * h))
+    elif derivative is not None:
+        # Só f'' é calculada: f' e f'' saem de uma passada de derivative com números duais
+        avaliar = lambda x: (f(x),) + tuple(valor_e_derivada(derivative, x))
+    elif diferencas_finitas:
+        def avaliar(x):
+            f_menos, fx, f_mais = f(x - h), f(x), f(x + h)
+            return fx, (f_mais - f_menos) / (2 * h), (f_mais - 2 * fx + f_menos) / h**2
+    else:
+        avaliar = lambda x: tuple(derivadas(f, x, 2))
+
+    iterados = [x0]
+    fx, dfx, d2fx = avaliar(x0)
+    for _ in range(max_iter):
+        if abs(fx) < e:
+            return x0, ordem_convergencia(iterados)
+
+        denominador = 2 * dfx**2 - fx * d2fx
+        if denominador == 0:
+            raise ValueError(f"O passo de Halley não está definido para x = {x0}.")
+
+        x1 = x0 - 2 * fx * dfx / denominador
+        iterados.append(x1)
+        fx, dfx, d2fx = avaliar(x1)
+
+        if abs(fx) < e or abs(x1 - x0) < e:
+            return x1, ordem_convergencia(iterados)
+
+        x0 = x1
+
+    raise ValueError("O método não convergiu...")
+
+
+def derivadas_inverso(d: list):
+    """
+    Derivadas de 1/f a partir de [f, f', ..., f^(n)]: de f·(1/f) = 1 e da regra de
+    Leibniz, g_k = -(1/f)·sum C(k, j)·f^(j)·g_k-j para j = 1..k.
+    """
+    g = [1 / d[0]]
+    for k in range(1, len(d)):
+        g.append(-sum(math.comb(k, j) * d[j] * g[k - j] for j in range(1, k + 1)) / d[0])
+    return g
+
+
+def householder(x0: float, max_iter: int, e: float, f = lambda x: ..., ordem: int = 3):
+    """
+    Método de Householder de ordem d: x1 = x0 + d·(1/f)^(d-1)(x0) / (1/f)^(d)(x0).
+
+    d = 1 é o método de Newton e d = 2 é o de Halley; a convergência é de ordem d + 1.
+    f e suas derivadas saem de uma única avaliação com números duais aninhados (f
+    deve usar as funções do NumPy, como np.sin e np.exp, em vez das do math), e as
+    derivadas de 1/f vêm delas pela regra de Leibniz.
+
+    Parâmetros:
+    x0 (float): Chute inicial.
+    max_iter (int): Número máximo de iterações.
+    e (float): Tolerância para |f(x)| e para |x1 - x0|.
+    f (função): A função f(x).
+    ordem (int): O d do método.
+
+    Retorna:
+    tuple: (raiz, ordem de convergência estimada, nan se o método parou com poucos
+    iterados acima do erro de arredondamento para estimá-la).
+    """
+    iterados = [x0]
+    d = derivadas(f, x0, ordem)
+    for _ in range(max_iter):
+        if abs(d[0]) < e:
+            return x0, ordem_convergencia(iterados)
+
+        g = derivadas_inverso(d)
+        if g[ordem] == 0:
+            raise ValueError(f"O passo de Householder não está definido para x = {x0}.")
+
+        x1 = x0 + ordem * g[ordem - 1] / g[ordem]
+        iterados.append(x1)
+        d = derivadas(f, x1, ordem)
+
+        if abs(d[0]) < e or abs(x1 - x0) < e:
+            return x1, ordem_convergencia(iterados)
+
+        x0 = x1
+
+    raise ValueError("O método não convergiu...")
+
+
+# EXEMPLO DE USO
+
+# f = lambda x: (x**np.log(x)) + x**2 + x**3 * np.sin(x)
+# intervalos = hunt_root(1, 20, f)
+
+# for a, b in intervalos:
+#     raiz, ordem = halley(a, 1000, 0.00001, f)
+#     print(f"A raiz encontrada no intervalo [{a},{b}] é: {raiz} (ordem estimada: {ordem:.2f})")
+#     raiz, ordem = householder(a, 1000, 0.00001, f, ordem=3)
+#     print(f"A raiz encontrada no intervalo [{a},{b}] é: {raiz} (ordem estimada: {ordem:.2f})")
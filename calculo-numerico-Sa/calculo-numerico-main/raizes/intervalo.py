@@ -0,0 +1,264 @@
+import math
+import numpy as np
+from dual import Dual
+
+
+def para_baixo(x):
+    return math.nextafter(x, -math.inf)
+
+
+def para_cima(x):
+    return math.nextafter(x, math.inf)
+
+
+class Intervalo:
+    """
+    Intervalo fechado [inf, sup] com arredondamento para fora.
+
+    Toda operação devolve um intervalo que contém todos os resultados possíveis
+    para valores dentro dos operandos, então f(Intervalo(a, b)) é uma cota
+    garantida da imagem de f em [a, b]. Funciona com os operadores do Python e
+    com algumas ufuncs do NumPy (np.sin, np.cos, np.exp, np.log, np.sqrt, ...),
+    inclusive dentro de um Dual (para obter também uma cota da derivada).
+
+    Parâmetros:
+    inf (float): Limite inferior.
+    sup (float): Limite superior (se omitido, o intervalo é o ponto [inf, inf]).
+    """
+
+    def __init__(self, inf, sup=None):
+        self.inf = float(inf)
+        self.sup = float(inf if sup is None else sup)
+        if self.inf > self.sup:
+            raise ValueError(f"Intervalo inválido: [{self.inf}, {self.sup}].")
+
+    def __repr__(self):
+        return f"Intervalo({self.inf!r}, {self.sup!r})"
+
+    @property
+    def meio(self):
+        return self.inf + (self.sup - self.inf) / 2
+
+    @property
+    def largura(self):
+        return self.sup - self.inf
+
+    def contem(self, x):
+        if isinstance(x, Intervalo):
+            return self.inf <= x.inf and x.sup <= self.sup
+        return self.inf <= x <= self.sup
+
+    def contem_no_interior(self, outro):
+        return self.inf < outro.inf and outro.sup < self.sup
+
+    def intersecao(self, outro):
+        """Interseção com outro intervalo (None se for vazia)."""
+        inf = max(self.inf, outro.inf)
+        sup = min(self.sup, outro.sup)
+        return Intervalo(inf, sup) if inf <= sup else None
+
+    def dividir(self):
+        m = self.meio
+        return Intervalo(self.inf, m), Intervalo(m, self.sup)
+
+    # Operações aritméticas
+    def __add__(self, outro):
+        outro = como_intervalo(outro)
+        return Intervalo(para_baixo(self.inf + outro.inf), para_cima(self.sup + outro.sup))
+
+    def __radd__(self, outro):
+        return como_intervalo(outro) + self
+
+    def __sub__(self, outro):
+        outro = como_intervalo(outro)
+        return Intervalo(para_baixo(self.inf - outro.sup), para_cima(self.sup - outro.inf))
+
+    def __rsub__(self, outro):
+        return como_intervalo(outro) - self
+
+    def __mul__(self, outro):
+        outro = como_intervalo(outro)
+        produtos = [p for p in (self.inf * outro.inf, self.inf * outro.sup, self.sup * outro.inf, self.sup * outro.sup)
+                    if not math.isnan(p)]  # 0·inf
+        return Intervalo(para_baixo(min(produtos, default=0.0)), para_cima(max(produtos, default=0.0)))
+
+    def __rmul__(self, outro):
+        return como_intervalo(outro) * self
+
+    def __truediv__(self, outro):
+        outro = como_intervalo(outro)
+        if outro.contem(0):
+            # Divisão por um intervalo que contém zero: o resultado pode ser qualquer real
+            return Intervalo(-math.inf, math.inf)
+        return self * Intervalo(para_baixo(1 / outro.sup), para_cima(1 / outro.inf))
+
+    def __rtruediv__(self, outro):
+        return como_intervalo(outro) / self
+
+    def __neg__(self):
+        return Intervalo(-self.sup, -self.inf)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        if self.inf >= 0:
+            return self
+        if self.sup <= 0:
+            return -self
+        return Intervalo(0.0, max(-self.inf, self.sup))
+
+    def __pow__(self, expoente):
+        if isinstance(expoente, (int, np.integer)) or (isinstance(expoente, float) and expoente.is_integer()):
+            n = int(expoente)
+            if n == 0:
+                return Intervalo(1.0)
+            if n < 0:
+                return 1 / self ** (-n)
+            a, b = self.inf ** n, self.sup ** n
+            if n % 2 == 0 and self.contem(0):
+                return Intervalo(0.0, para_cima(max(a, b)))
+            return Intervalo(para_baixo(min(a, b)), para_cima(max(a, b)))
+        # Expoente real (ou intervalo): x^y = exp(y·ln(x)), exige x > 0
+        return np.exp(expoente * np.log(self))
+
+    def __rpow__(self, base):
+        return np.exp(self * np.log(como_intervalo(base)))
+
+    def __array_ufunc__(self, ufunc, method, *entradas, **kwargs):
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        if any(isinstance(x, Dual) for x in entradas):
+            return NotImplemented  # Deixa o Dual tratar (o valor dele pode ser um Intervalo)
+
+        if ufunc in OPERADORES:
+            a, b = (como_intervalo(x) for x in entradas)
+            return OPERADORES[ufunc](a, b)
+
+        if ufunc in FUNCOES and len(entradas) == 1:
+            return FUNCOES[ufunc](entradas[0])
+
+        return NotImplemented
+
+
+def como_intervalo(x):
+    return x if isinstance(x, Intervalo) else Intervalo(x)
+
+
+def monotona_crescente(funcao, dominio=(-math.inf, math.inf)):
+    def aplicar(x):
+        if x.inf < dominio[0] or x.sup > dominio[1]:
+            raise ValueError(f"{x} fora do domínio da função.")
+        return Intervalo(para_baixo(funcao(x.inf)), para_cima(funcao(x.sup)))
+    return aplicar
+
+
+def trigonometrica(funcao, fase_maximo):
+    # funcao em [a, b]: além dos extremos, vale 1 se [a, b] contiver fase_maximo + 2kπ
+    # e -1 se contiver fase_maximo + π + 2kπ
+    def aplicar(x):
+        a, b = x.inf, x.sup
+        if b - a >= 2 * math.pi:
+            return Intervalo(-1.0, 1.0)
+        inf = min(funcao(a), funcao(b))
+        sup = max(funcao(a), funcao(b))
+        folga = 4 * math.ulp(max(abs(a), abs(b), 1.0))  # π não é exato
+        for fase, extremo in ((fase_maximo, "sup"), (fase_maximo + math.pi, "inf")):
+            primeiro_k = math.ceil((a - folga - fase) / (2 * math.pi))
+            ultimo_k = math.floor((b + folga - fase) / (2 * math.pi))
+            if ultimo_k >= primeiro_k:
+                if extremo == "sup":
+                    sup = 1.0
+                else:
+                    inf = -1.0
+        return Intervalo(max(para_baixo(inf), -1.0), min(para_cima(sup), 1.0))
+    return aplicar
+
+
+OPERADORES = {
+    np.add: Intervalo.__add__,
+    np.subtract: Intervalo.__sub__,
+    np.multiply: Intervalo.__mul__,
+    np.true_divide: Intervalo.__truediv__,
+    np.power: Intervalo.__pow__,
+}
+
+FUNCOES = {
+    np.negative: Intervalo.__neg__,
+    np.absolute: Intervalo.__abs__,
+    np.square: lambda x: x ** 2,
+    np.sin: trigonometrica(math.sin, math.pi / 2),
+    np.cos: trigonometrica(math.cos, 0.0),
+    np.exp: monotona_crescente(math.exp),
+    np.log: monotona_crescente(math.log, (0.0, math.inf)),
+    np.sqrt: monotona_crescente(math.sqrt, (0.0, math.inf)),
+    np.arctan: monotona_crescente(math.atan),
+    np.tanh: monotona_crescente(math.tanh),
+    np.sinh: monotona_crescente(math.sinh),
+}
+
+
+def newton_intervalar(f, a: float, b: float, tol: float = 1e-10, max_iter: int = 10000):
+    """
+    Encontra cotas garantidas de todas as raízes de f em [a, b] (Newton intervalar).
+
+    Para cada subintervalo X, f(X) e f'(X) são cotados de uma vez avaliando f em
+    Dual(X, 1). Se 0 não está em f(X), X inteiro é descartado (não há raiz).
+    Senão aplica o operador de Newton N(X) = m - f(m)/f'(X) e continua em X ∩ N(X);
+    quando N(X) cai no interior de X, fica provado que X tem exatamente uma raiz.
+    Se f'(X) contém zero, X é dividido ao meio.
+
+    Parâmetros:
+    f (função): A função f(x), escrita com operadores e funções do NumPy.
+    a, b (float): O intervalo de busca.
+    tol (float): Largura máxima dos intervalos devolvidos.
+    max_iter (int): Número máximo de subintervalos processados.
+
+    Retorna:
+    list: Pares (Intervalo, certificado). Todas as raízes de f em [a, b] estão
+    nesses intervalos; certificado=True garante uma única raiz no intervalo.
+    """
+    pilha = [(Intervalo(a, b), False)]
+    resultados = []
+
+    for _ in range(max_iter):
+        if not pilha:
+            break
+        X, certificado = pilha.pop()
+
+        y = f(Dual(X, 1.0))
+        FX, DFX = (y.valor, y.derivada) if isinstance(y, Dual) else (como_intervalo(y), Intervalo(0.0))
+        if not FX.contem(0):
+            continue  # Sem raiz em X
+
+        if DFX.contem(0):
+            if X.largura <= tol:
+                resultados.append((X, False))
+            else:
+                pilha.extend((metade, False) for metade in X.dividir())
+            continue
+
+        m = X.meio
+        N = m - como_intervalo(f(Intervalo(m))) / DFX
+        novo = X.intersecao(N)
+        if novo is None:
+            continue  # Sem raiz em X
+        certificado = certificado or X.contem_no_interior(N)
+
+        if novo.largura <= tol:
+            resultados.append((novo, certificado))
+        elif novo.largura <= X.largura / 2:
+            pilha.append((novo, certificado))
+        else:
+            pilha.extend((metade, False) for metade in novo.dividir())
+
+    # O que sobrou na pilha ainda pode conter raízes, mas sem garantia
+    resultados.extend((X, False) for X, _ in pilha)
+    return sorted(resultados, key=lambda r: r[0].inf)
+
+
+# EXEMPLO DE USO
+
+# f = lambda x: (x**np.log(x)) + x**2 + x**3 * np.sin(x)
+# for intervalo, certificado in newton_intervalar(f, 1, 20):
+#     print(f"Raiz em [{intervalo.inf}, {intervalo.sup}] (única garantida: {certificado})")
@@ -0,0 +1,157 @@
+import cmath
+import numpy as np
+from dual import valor_e_derivada
+
+
+def muller(x0: complex, x1: complex, x2: complex, max_iter: int, e: float, f = lambda x: ...):
+    """
+    Método de Muller: ajusta uma parábola pelos três últimos pontos e toma a raiz dela
+    mais próxima de x2. Como usa a raiz quadrada complexa, chega a raízes complexas
+    mesmo partindo de chutes reais.
+
+    Parâmetros:
+    x0, x1, x2 (complex): Três chutes iniciais distintos.
+    max_iter (int): Número máximo de iterações.
+    e (float): Tolerância para |f(x)| e para |x3 - x2|.
+    f (função): A função f(x) (pode receber e devolver complexos).
+
+    Retorna:
+    complex: A raiz encontrada.
+    """
+    f0, f1, f2 = f(x0), f(x1), f(x2)
+    for _ in range(max_iter):
+        if abs(f2) < e:
+            return complex(x2)
+
+        h1, h2 = x1 - x0, x2 - x1
+        d1, d2 = (f1 - f0) / h1, (f2 - f1) / h2
+        a = (d2 - d1) / (h2 + h1)
+        b = a * h2 + d2
+        raiz = cmath.sqrt(b * b - 4 * f2 * a)
+        # Escolhe o sinal que deixa o denominador maior (passo menor e mais estável)
+        denominador = b + raiz if abs(b + raiz) >= abs(b - raiz) else b - raiz
+        if denominador == 0:
+            raise ValueError(f"O passo de Muller não está definido para x = {x2}.")
+
+        x3 = x2 - 2 * f2 / denominador
+        f3 = f(x3)
+        if abs(f3) < e or abs(x3 - x2) < e:
+            return complex(x3)
+
+        x0, x1, x2 = x1, x2, x3
+        f0, f1, f2 = f1, f2, f3
+
+    raise ValueError("O método não convergiu...")
+
+
+def newton_complexo(z0: complex, max_iter: int, e: float, f = lambda z: ..., derivative = None):
+    """
+    Newton no plano complexo; sem derivative, f'(z) sai de números duais com valor complexo.
+
+    Parâmetros:
+    z0 (complex): Chute inicial.
+    max_iter (int): Número máximo de iterações.
+    e (float): Tolerância para |f(z)| e para |z1 - z0|.
+    f (função): A função f(z), escrita com operadores e funções do NumPy.
+    derivative (função): f'(z) (opcional).
+
+    Retorna:
+    complex: A raiz encontrada.
+    """
+    if derivative is None:
+        avaliar = lambda z: valor_e_derivada(f, z)
+    else:
+        avaliar = lambda z: (f(z), derivative(z))
+
+    z0 = complex(z0)
+    fz, dfz = avaliar(z0)
+    for _ in range(max_iter):
+        if abs(fz) < e:
+            return z0
+
+        if dfz == 0:
+            raise ValueError(f"A derivada de f(z) para este z = {z0} é zero...")
+
+        z1 = z0 - fz / dfz
+        fz, dfz = avaliar(z1)
+
+        if abs(fz) < e or abs(z1 - z0) < e:
+            return complex(z1)
+
+        z0 = z1
+
+    raise ValueError("O método não convergiu...")
+
+
+def agrupar_raizes(raizes, tol: float):
+    """Remove raízes repetidas: raízes a menos de tol·max(|z|, 1) de outra são a mesma."""
+    restantes = np.asarray(raizes, dtype=complex)
+    unicas = []
+    while restantes.size:
+        z = restantes[0]
+        mesmas = np.abs(restantes - z) <= tol * max(abs(z), 1)
+        unicas.append(restantes[mesmas].mean())
+        restantes = restantes[~mesmas]
+    unicas = np.array(unicas, dtype=complex)
+    return unicas[np.lexsort((unicas.imag, unicas.real))]
+
+
+def raizes_complexas(f, real: tuple, imaginario: tuple, n: int = 20, max_iter: int = 50, e: float = 1e-12,
+                     tol_agrupamento: float = 1e-8, derivative = None):
+    """
+    Procura todas as raízes de f em uma região do plano complexo espalhando uma grade
+    n x n de chutes e iterando Newton em todos eles ao mesmo tempo.
+
+    Chutes que divergem ou não convergem em max_iter iterações são descartados; as
+    raízes convergidas são agrupadas para remover as repetidas.
+
+    Parâmetros:
+    f (função): A função f(z), vetorizada (operadores e funções do NumPy).
+    real, imaginario (tuple): Faixas (mínimo, máximo) da parte real e imaginária dos chutes.
+    n (int): Número de chutes por eixo.
+    max_iter (int): Número máximo de iterações de Newton.
+    e (float): Tolerância relativa do passo de Newton.
+    tol_agrupamento (float): Distância relativa abaixo da qual duas raízes são a mesma.
+    derivative (função): f'(z) vetorizada (opcional; senão usa números duais).
+
+    Retorna:
+    array: As raízes distintas, ordenadas pela parte real.
+    """
+    if derivative is None:
+        avaliar = lambda z: valor_e_derivada(f, z)
+    else:
+        avaliar = lambda z: (f(z), derivative(z))
+
+    re, im = np.meshgrid(np.linspace(*real, n), np.linspace(*imaginario, n))
+    z = (re + 1j * im).ravel()
+    ativo = np.ones(z.size, dtype=bool)
+    convergiu = np.zeros(z.size, dtype=bool)
+
+    for _ in range(max_iter):
+        indices = np.flatnonzero(ativo)
+        if indices.size == 0:
+            break
+
+        with np.errstate(all="ignore"):
+            fz, dfz = avaliar(z[indices])
+            passo = np.asarray(fz / dfz, dtype=complex) * np.ones(indices.size)
+
+        valido = np.isfinite(passo)
+        z[indices[valido]] -= passo[valido]
+        pronto = valido & (np.abs(passo) <= e * (1 + np.abs(z[indices])))
+
+        convergiu[indices[pronto]] = True
+        ativo[indices[pronto | ~valido]] = False
+
+    return agrupar_raizes(z[convergiu], tol_agrupamento)
+
+
+# EXEMPLO DE USO
+
+# f = lambda z: z**3 - 1
+# print(muller(0.5, 1.5, 2.0, 100, 1e-12, f))
+# print(newton_complexo(-1 + 1j, 100, 1e-12, f))
+
+# # Equação característica com atraso: z + e^(-z) = 0 (infinitas raízes complexas)
+# g = lambda z: z + np.exp(-z)
+# print(raizes_complexas(g, (-5, 5), (-20, 20), n=40))
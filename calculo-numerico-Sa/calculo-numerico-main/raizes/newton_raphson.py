@@ -1,24 +1,94 @@
 import numpy as np
 import math
 from achar_raiz import hunt_root
+from dual import valor_e_derivada
 
-def newton_raphson(x0: float, max_iter: int, e: float, f = lambda x: ..., derivative = lambda x: ...):
+def newton_raphson(x0: float, max_iter: int, e: float, f = lambda x: ..., derivative = None):
+    # Sem derivative, f(x) e f'(x) exatos saem de uma única avaliação com números duais
+    if derivative is None:
+        avaliar = lambda x: valor_e_derivada(f, x)
+    else:
+        avaliar = lambda x: (f(x), derivative(x))
+
+    fx, dfx = avaliar(x0)
     for _ in range(max_iter):
-        if abs(f(x0)) < e:
+        if abs(fx) < e:
             return x0
         
-        if derivative(x0) == 0:
-            raise f"A derivada de f(x) para este x = {x0} é zero..."
+        if dfx == 0:
+            raise ValueError(f"A derivada de f(x) para este x = {x0} é zero...")
         
-        x1 = x0 - (f(x0)/derivative(x0))
+        x1 = x0 - (fx/dfx)
+        fx, dfx = avaliar(x1)
         
-        if abs(f(x1)) < e or abs(x1 - x0) < e:
+        if abs(fx) < e or abs(x1 - x0) < e:
             x = x1
             return x
         
         x0 = x1
     
-    raise "O método não convergiu..."
+    raise ValueError("O método não convergiu...")
+
+
+def newton_multiplicidade(x0: float, max_iter: int, e: float, f = lambda x: ..., derivative = None):
+    """
+    Newton para raízes múltiplas, com estimativa automática da multiplicidade.
+
+    Numa raiz de multiplicidade m o passo de Newton d = f/f' encolhe na razão
+    d_k+1 / d_k ≈ (m - 1)/m, então m ≈ 1 / (1 - d_k+1 / d_k). Quando duas
+    estimativas seguidas ficam perto do mesmo inteiro, o passo passa a ser
+    x - m·f/f' (Newton modificado), que volta a ter convergência quadrática.
+    A estimativa continua sendo atualizada depois da troca, o que corrige um m errado.
+
+    Parâmetros:
+    x0 (float): Chute inicial.
+    max_iter (int): Número máximo de iterações.
+    e (float): Tolerância para |f(x)| e para |x1 - x0|.
+    f (função): A função f(x).
+    derivative (função): f'(x) (opcional; senão usa números duais).
+
+    Retorna:
+    tuple: (raiz, multiplicidade estimada).
+    """
+    if derivative is None:
+        avaliar = lambda x: valor_e_derivada(f, x)
+    else:
+        avaliar = lambda x: (f(x), derivative(x))
+
+    m = 1
+    candidato = None  # Última estimativa arredondada, esperando confirmação
+    passo_anterior = None
+
+    fx, dfx = avaliar(x0)
+    for _ in range(max_iter):
+        if abs(fx) < e:
+            return x0, m
+
+        if dfx == 0:
+            raise ValueError(f"A derivada de f(x) para este x = {x0} é zero...")
+
+        passo = fx / dfx
+        if passo_anterior is not None and passo / passo_anterior < 1:
+            # Com o passo x - m·f/f', o erro encolhe na razão 1 - m/m_real
+            estimativa = m / (1 - passo / passo_anterior)
+            inteiro = max(round(estimativa), 1)
+            if abs(estimativa - inteiro) < 0.25:
+                if inteiro == candidato:
+                    m = inteiro
+                candidato = inteiro
+            else:
+                candidato = None
+
+        x1 = x0 - m * passo
+        passo_anterior = passo
+        fx, dfx = avaliar(x1)
+
+        if abs(fx) < e or abs(x1 - x0) < e:
+            return x1, m
+
+        x0 = x1
+
+    raise ValueError("O método não convergiu...")
 
 
 # EXEMPLO DE USO
@@ -30,3 +100,18 @@ def newton_raphson(x0: float, max_iter: int, e: float, f = lambda x: ..., deriva
 # for a, b in intervalos:
 #     raiz = newton_raphson(a, 1000, 0.00001, f, deriv_f)
 #     print(f"A raiz encontrada no intervalo [{a},{b}] é: {raiz}")
+
+# EXEMPLO DE USO (DERIVADA AUTOMÁTICA)
+
+# f = lambda x: (x**np.log(x)) + x**2 + x**3 * np.sin(x)
+# intervalos = hunt_root(1, 20, f)
+
+# for a, b in intervalos:
+#     raiz = newton_raphson(a, 1000, 0.00001, f)
+#     print(f"A raiz encontrada no intervalo [{a},{b}] é: {raiz}")
+
+# EXEMPLO DE USO (RAIZ MÚLTIPLA)
+
+# f = lambda x: (x - 1)**3 * (x + 2)
+# raiz, m = newton_multiplicidade(3, 1000, 1e-12, f)
+# print(f"A raiz encontrada é: {raiz} (multiplicidade {m})")
@@ -0,0 +1,331 @@
+import numpy as np
+
+
+def coeficientes_crescentes(p):
+    """
+    Converte um polinômio para o vetor de coeficientes [a0, a1, ..., an] (grau crescente).
+
+    Aceita um np.poly1d (que guarda os coeficientes em grau decrescente) ou uma
+    lista/array já em grau crescente, como os coeficientes obtidos pela matriz de
+    Vandermonde. Zeros nos graus mais altos são removidos.
+
+    Parâmetros:
+    p (np.poly1d ou list): O polinômio.
+
+    Retorna:
+    array: Os coeficientes em grau crescente.
+    """
+    if isinstance(p, np.poly1d):
+        coefs = np.asarray(p.coeffs)[::-1]
+    else:
+        coefs = np.asarray(p)
+    coefs = coefs.astype(complex if np.iscomplexobj(coefs) else float)
+
+    nao_nulos = np.flatnonzero(coefs)
+    if nao_nulos.size == 0:
+        raise ValueError("O polinômio é identicamente nulo.")
+    return coefs[:nao_nulos[-1] + 1]
+
+
+def forma_newton_para_coeficientes(coef_in_first_line: list, X: list):
+    """
+    Converte a forma de Newton c0 + c1(x - x0) + c2(x - x0)(x - x1) + ...
+    para os coeficientes [a0, a1, ..., an] em grau crescente.
+
+    Parâmetros:
+    coef_in_first_line (list): As diferenças divididas (primeira linha da tabela de interpolacao/newton.py).
+    X (list): Os pontos x usados na interpolação.
+
+    Retorna:
+    array: Os coeficientes em grau crescente.
+    """
+    n = len(coef_in_first_line)
+    coefs = np.array([coef_in_first_line[-1]], dtype=float)
+    # Horner na forma de Newton: p = p·(x - X[k]) + c_k, de dentro para fora
+    for k in range(n - 2, -1, -1):
+        coefs = np.append(0.0, coefs) - X[k] * np.append(coefs, 0.0)
+        coefs[0] += coef_in_first_line[k]
+    return coefs
+
+
+def horner(coefs, x):
+    """
+    Avalia o polinômio e a sua derivada em x (escalar ou array) pelo método de Horner.
+
+    Parâmetros:
+    coefs (array): Coeficientes em grau crescente.
+    x (número ou array): Pontos de avaliação (podem ser complexos).
+
+    Retorna:
+    tuple: (p(x), p'(x)).
+    """
+    p = np.zeros_like(x) + coefs[-1]
+    dp = np.zeros_like(p)
+    for a in coefs[-2::-1]:
+        dp = dp * x + p
+        p = p * x + a
+    return p, dp
+
+
+def matriz_companheira(coefs):
+    """Matriz companheira do polinômio (os autovalores são as raízes)."""
+    n = len(coefs) - 1
+    C = np.zeros((n, n), dtype=np.result_type(coefs, float))
+    C[1:, :-1] = np.eye(n - 1)
+    C[:, -1] = -coefs[:-1] / coefs[-1]
+    return C
+
+
+def aberth(coefs, max_iter: int = 100, tol: float = 1e-14):
+    """
+    Método de Aberth–Ehrlich: refina todas as raízes ao mesmo tempo, com arrays do NumPy.
+
+    Parâmetros:
+    coefs (array): Coeficientes em grau crescente.
+    max_iter (int): Número máximo de iterações.
+    tol (float): Tolerância relativa para o tamanho da correção.
+
+    Retorna:
+    array: As n raízes (complexas).
+    """
+    n = len(coefs) - 1
+
+    # Chutes iniciais em um círculo de raio dado pela média geométrica das raízes,
+    # com um ângulo deslocado para não cair em simetrias do polinômio
+    raio = abs(coefs[0] / coefs[-1]) ** (1 / n) if coefs[0] != 0 else 1.0
+    z = raio * np.exp(1j * (2 * np.pi * np.arange(n) / n + 0.4))
+
+    for _ in range(max_iter):
+        p, dp = horner(coefs, z)
+        ativo = p != 0
+        if not ativo.any():
+            break
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            w = p / dp
+            diferencas = z[:, None] - z[None, :]
+            np.fill_diagonal(diferencas, np.inf)
+            soma = np.sum(1 / diferencas, axis=1)
+            correcao = np.where(ativo, w / (1 - w * soma), 0)
+
+        correcao[~np.isfinite(correcao)] = 0
+        z = z - correcao
+        if np.all(np.abs(correcao) <= tol * np.maximum(np.abs(z), 1)):
+            break
+
+    return z
+
+
+def polir_raizes(coefs, raizes, passos: int = 2):
+    """
+    Aplica alguns passos de Newton em todas as raízes ao mesmo tempo, com salvaguardas.
+
+    Perto de uma raiz múltipla p e p' ficam os dois no nível do arredondamento e o
+    passo p/p' vira ruído de tamanho O(1). Por isso uma raiz não é mexida quando
+    |p(z)| ou |p'(z)| já estão abaixo da cota do erro de arredondamento do Horner
+    (2n·eps·sum |a_k|·|z|^k, e o análogo para p'); o passo é limitado à metade da
+    distância até a raiz mais próxima; e só é aceito se diminuir |p(z)|.
+
+    Parâmetros:
+    coefs (array): Coeficientes em grau crescente.
+    raizes (array): As aproximações das raízes.
+    passos (int): Número máximo de passos de Newton.
+
+    Retorna:
+    array: As raízes polidas (complexas).
+    """
+    raizes = np.asarray(raizes, dtype=complex)
+    n = len(coefs) - 1
+    if n < 1 or raizes.size == 0:
+        return raizes
+
+    eps = np.finfo(float).eps
+    absolutos = np.abs(coefs)
+    if raizes.size > 1:
+        distancias = np.abs(raizes[:, None] - raizes[None, :])
+        np.fill_diagonal(distancias, np.inf)
+        limite = distancias.min(axis=1) / 2
+    else:
+        limite = np.full(1, np.inf)
+
+    for _ in range(passos):
+        p, dp = horner(coefs, raizes)
+        cota_p, cota_dp = horner(absolutos, np.abs(raizes))
+        ativo = (np.abs(p) > 2 * n * eps * cota_p) & (np.abs(dp) > 2 * n * eps * cota_dp)
+        if not ativo.any():
+            break
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            passo = np.where(ativo, p / dp, 0)
+            tamanho = np.abs(passo)
+            passo = np.where(tamanho > limite, passo * limite / tamanho, passo)
+        passo[~np.isfinite(passo)] = 0
+
+        novas = raizes - passo
+        melhorou = np.abs(horner(coefs, novas)[0]) < np.abs(p)
+        raizes = np.where(ativo & melhorou, novas, raizes)
+    return raizes
+
+
+def laguerre(coefs, x0: complex = 0, max_iter: int = 100, tol: float = 1e-14):
+    """
+    Método de Laguerre: converge (cubicamente) para uma raiz a partir de quase qualquer chute.
+
+    Parâmetros:
+    coefs (array): Coeficientes em grau crescente.
+    x0 (complex): Chute inicial (o padrão 0 tende a achar a raiz de menor módulo).
+    max_iter (int): Número máximo de iterações.
+    tol (float): Tolerância relativa para o tamanho do passo.
+
+    Retorna:
+    complex: A raiz encontrada.
+    """
+    n = len(coefs) - 1
+    x = complex(x0)
+    for _ in range(max_iter):
+        # p, p' e p'' por Horner
+        p, dp, d2p = complex(coefs[-1]), 0j, 0j
+        for a in coefs[-2::-1]:
+            d2p = d2p * x + 2 * dp
+            dp = dp * x + p
+            p = p * x + a
+        if p == 0:
+            return x
+
+        G = dp / p
+        H = G * G - d2p / p
+        raiz = np.sqrt((n - 1) * (n * H - G * G))
+        denominador = G + raiz if abs(G + raiz) >= abs(G - raiz) else G - raiz
+        # Denominador nulo: dá um passo arbitrário para sair do ponto crítico
+        passo = n / denominador if denominador != 0 else (1 + abs(x)) * np.exp(1j * 0.4)
+        x = x - passo
+        if abs(passo) <= tol * max(abs(x), 1):
+            break
+    return x
+
+
+def deflacionar(coefs, raiz: complex):
+    """
+    Divide o polinômio por (x - raiz) de forma estável.
+
+    Se |raiz| não passa da média geométrica dos módulos das raízes, |a0/an|^(1/n),
+    a divisão sintética vai do maior grau para o menor (deflação para frente);
+    senão vai do termo constante para o maior grau (deflação para trás). Raízes
+    pequenas saem bem pela frente e raízes grandes por trás, então o erro de
+    arredondamento não é amplificado pelas raízes que ficam.
+
+    Parâmetros:
+    coefs (array): Coeficientes em grau crescente.
+    raiz (complex): A raiz a ser removida.
+
+    Retorna:
+    array: Os coeficientes do quociente, em grau crescente.
+    """
+    n = len(coefs) - 1
+    q = np.zeros(n, dtype=np.result_type(coefs, raiz))
+    if coefs[0] == 0 or abs(raiz) <= abs(coefs[0] / coefs[-1]) ** (1 / n):
+        q[-1] = coefs[-1]
+        for k in range(n - 1, 0, -1):
+            q[k - 1] = coefs[k] + raiz * q[k]
+    else:
+        q[0] = -coefs[0] / raiz
+        for k in range(1, n):
+            q[k] = (q[k - 1] - coefs[k]) / raiz
+    return q
+
+
+def raizes_deflacao(coefs, max_iter: int = 100, tol: float = 1e-14, passos_polimento: int = 2):
+    """
+    Acha as raízes uma a uma com Laguerre, removendo cada uma do polinômio (deflação)
+    antes de procurar a próxima. Em polinômios reais, uma raiz complexa sai junto
+    com a conjugada para os coeficientes continuarem reais.
+
+    No final as raízes passam pelo polir_raizes no polinômio original, que corrige
+    o erro acumulado pela deflação e deixa intactas as raízes em que Laguerre já
+    convergiu (|p| no nível do arredondamento), inclusive as múltiplas.
+
+    Parâmetros:
+    coefs (array): Coeficientes em grau crescente.
+    max_iter (int): Número máximo de iterações de Laguerre por raiz.
+    tol (float): Tolerância relativa de Laguerre.
+    passos_polimento (int): Passos de Newton (com salvaguardas) no polinômio original.
+
+    Retorna:
+    array: As n raízes (complexas).
+    """
+    real = not np.iscomplexobj(coefs)
+    atual = np.asarray(coefs, dtype=complex)
+    raizes = []
+    while len(atual) > 1:
+        r = laguerre(atual, 0, max_iter, tol)
+        if real and len(atual) > 2 and abs(r.imag) > 1e-10 * max(abs(r), 1):
+            atual = deflacionar(deflacionar(atual, r), r.conjugate())
+            raizes.extend((r, r.conjugate()))
+            atual = atual.real.astype(complex)
+        else:
+            if real:
+                r = complex(r.real)
+            atual = deflacionar(atual, r)
+            raizes.append(r)
+    return polir_raizes(coefs, np.array(raizes, dtype=complex), passos_polimento)
+
+
+def raizes_polinomio(p, metodo: str = "companheira", passos_polimento: int = 2, max_iter: int = 100):
+    """
+    Encontra todas as raízes (reais e complexas) de um polinômio de uma só vez.
+
+    Parâmetros:
+    p (np.poly1d ou list): O polinômio (lista em grau crescente, como na Vandermonde).
+    metodo (str): "companheira" (autovalores da matriz companheira), "aberth" ou
+    "deflacao" (Laguerre + deflação, O(n²) no total).
+    passos_polimento (int): Passos de Newton com salvaguardas (ver polir_raizes)
+    aplicados em cada raiz no final, sempre no polinômio original (corrige o erro
+    acumulado pela deflação sem estragar raízes múltiplas).
+    max_iter (int): Número máximo de iterações do método de Aberth ou de Laguerre.
+
+    Retorna:
+    array: As raízes complexas, ordenadas pela parte real.
+    """
+    coefs = coeficientes_crescentes(p)
+    if len(coefs) == 1:
+        return np.zeros(0, dtype=complex)
+
+    if metodo == "companheira":
+        raizes = np.linalg.eigvals(matriz_companheira(coefs))
+    elif metodo == "aberth":
+        raizes = aberth(coefs, max_iter)
+    elif metodo == "deflacao":
+        # O polimento já é feito dentro de raizes_deflacao
+        raizes = raizes_deflacao(coefs, max_iter, passos_polimento=passos_polimento)
+    else:
+        raise ValueError("Método inválido. Escolha entre 'companheira', 'aberth' ou 'deflacao'.")
+
+    if metodo != "deflacao":
+        raizes = polir_raizes(coefs, raizes, passos_polimento)
+    return raizes[np.lexsort((raizes.imag, raizes.real))]
+
+
+def raizes_reais(raizes, tol: float = 1e-9):
+    """Filtra as raízes com parte imaginária desprezível e devolve as partes reais."""
+    raizes = np.asarray(raizes)
+    reais = np.abs(raizes.imag) <= tol * np.maximum(np.abs(raizes), 1)
+    return np.sort(raizes[reais].real)
+
+
+# EXEMPLO DE USO
+
+# # Coeficientes da Vandermonde (grau crescente): p(x) = -6 + 11x - 6x^2 + x^3
+# print(raizes_polinomio([-6, 11, -6, 1]))
+
+# # np.poly1d (grau decrescente), como no find_root de achar_raiz.py
+# print(raizes_polinomio(np.poly1d([1, 0, 1]), metodo="aberth"))
+
+# # Laguerre + deflação, sem varrer o intervalo de novo a cada raiz
+# print(raizes_polinomio(np.poly1d(np.arange(1, 11), r=True), metodo="deflacao"))
+
+# # Forma de Newton (interpolacao/newton.py)
+# from interpolacao.newton import newton_coeficients
+# X = [-2, 0, 1]
+# Y = [2, 1, 3]
+# coefs = forma_newton_para_coeficientes(newton_coeficients(X, Y)[0], X)
+# print(raizes_reais(raizes_polinomio(coefs)))
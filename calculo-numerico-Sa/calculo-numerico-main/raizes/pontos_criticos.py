@@ -1,4 +1,5 @@
 import numpy as np
+from achar_raiz import avaliar_em_array
 
 def derivada_numerica(f, x, h=1e-5):
     """
@@ -14,6 +15,89 @@ def derivada_numerica(f, x, h=1e-5):
     """
     return (f(x + h) - f(x - h)) / (2 * h)
 
+def agrupar_pontos(pontos, tol=1e-6):
+    """
+    Junta pontos próximos em um só representante.
+
+    Os pontos são ordenados e um novo grupo começa sempre que a distância para
+    o ponto anterior passa de tol. Cada grupo é representado pela sua média.
+
+    Parâmetros:
+    pontos (array): Os pontos a serem agrupados.
+    tol (float): Maior distância entre vizinhos de um mesmo grupo.
+
+    Retorna:
+    tuple: (representantes, tamanhos) com o ponto médio e o número de pontos de cada grupo.
+    """
+    pontos = np.sort(np.asarray(pontos, dtype=float))
+    if pontos.size == 0:
+        return pontos, np.zeros(0, dtype=int)
+
+    inicios = np.concatenate(([0], np.flatnonzero(np.diff(pontos) > tol) + 1))
+    tamanhos = np.diff(np.append(inicios, pontos.size))
+    representantes = np.add.reduceat(pontos, inicios) / tamanhos
+    return representantes, tamanhos
+
+
+def encontrar_pontos_criticos_lote(f, intervalo, n_sementes=1000000, tol=1e-6, max_iter=1000, h=1e-5):
+    """
+    Encontra os pontos críticos de f(x) no intervalo aplicando o método de Newton
+    em f'(x) a partir de todas as sementes ao mesmo tempo (com arrays do NumPy).
+
+    As derivadas são aproximadas por diferenças centrais, com as três avaliações
+    de f (x - h, x, x + h) feitas em uma única chamada por iteração. Sementes que
+    convergem ou divergem (f'' nula, valores não finitos ou saída do intervalo)
+    são retiradas do conjunto ativo.
+
+    Parâmetros:
+    f (função): A função f(x), de preferência vetorizada.
+    intervalo (tuple): O intervalo (a, b) onde os pontos críticos serão buscados.
+    n_sementes (int): Número de chutes iniciais distribuídos no intervalo.
+    tol (float): Tolerância para |f'(x)| e para juntar pontos repetidos.
+    max_iter (int): Número máximo de iterações.
+    h (float): Passo das diferenças finitas.
+
+    Retorna:
+    tuple: (pontos_criticos, contagem), onde contagem é um dicionário com o número
+    de avaliações de f, de chamadas de f, de iterações e de sementes que convergiram
+    ou divergiram.
+    """
+    a, b = intervalo
+    x = np.linspace(a, b, n_sementes)
+    convergidos = []
+    contagem = {"avaliacoes": 0, "chamadas": 0, "iteracoes": 0, "convergiram": 0, "divergiram": 0}
+
+    for _ in range(max_iter):
+        if x.size == 0:
+            break
+
+        # Avalia f em x - h, x e x + h de uma só vez
+        valores = avaliar_em_array(f, np.concatenate((x - h, x, x + h)))
+        f_menos, f_x, f_mais = np.split(valores, 3)
+        contagem["avaliacoes"] += valores.size
+        contagem["chamadas"] += 1
+        contagem["iteracoes"] += 1
+
+        derivada = (f_mais - f_menos) / (2 * h)
+        segunda_derivada = (f_mais - 2 * f_x + f_menos) / h**2
+
+        convergiu = np.abs(derivada) < tol
+        convergidos.append(x[convergiu])
+        contagem["convergiram"] += int(convergiu.sum())
+
+        # Atualiza x usando o método de Newton só onde f''(x) é utilizável
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_novo = x - derivada / segunda_derivada
+        valido = ~convergiu & (segunda_derivada != 0) & np.isfinite(x_novo) & (x_novo >= a) & (x_novo <= b)
+        contagem["divergiram"] += int((~convergiu & ~valido).sum())
+        x = x_novo[valido]
+
+    # Remove duplicatas juntando pontos críticos próximos
+    pontos_criticos, _ = agrupar_pontos(np.concatenate(convergidos) if convergidos else [], tol=max(tol, 10 * h))
+
+    return pontos_criticos, contagem
+
+
 def encontrar_pontos_criticos(f, intervalo, tol=1e-6, max_iter=1000):
     """
     Encontra os pontos críticos de uma função f(x) no intervalo dado.
@@ -25,30 +109,9 @@ def encontrar_pontos_criticos(f, intervalo, tol=1e-6, max_iter=1000):
     max_iter (int): Número máximo de iterações.
 
     Retorna:
-    list: Uma lista de pontos críticos (valores de x).
+    array: Os pontos críticos (valores de x).
     """
-    a, b = intervalo
-    pontos_criticos = []
-
-    # Divide o intervalo em pequenos subintervalos para buscar pontos críticos
-    x_values = np.linspace(a, b, 1000000)
-    for x in x_values:
-        # Usa o método de Newton para encontrar onde f'(x) = 0
-        x_atual = x
-        for _ in range(max_iter):
-            derivada = derivada_numerica(f, x_atual)
-            if abs(derivada) < tol:
-                pontos_criticos.append(x_atual)
-                break
-            # Atualiza x usando o método de Newton
-            segunda_derivada = (derivada_numerica(f, x_atual + tol) - derivada_numerica(f, x_atual - tol)) / (2 * tol)
-            if segunda_derivada == 0:
-                break  # Evita divisão por zero
-            x_atual = x_atual - derivada / segunda_derivada
-
-    # Remove duplicatas e arredonda os valores
-    pontos_criticos = np.unique(np.round(pontos_criticos, decimals=6))
-
+    pontos_criticos, _ = encontrar_pontos_criticos_lote(f, intervalo, tol=tol, max_iter=max_iter)
     return pontos_criticos
 
 # Exemplo de uso
@@ -56,5 +119,6 @@ def f(x):
     return x**3 - 3*x**2 + 2*x  # Função exemplo
 
 intervalo = (-4, 4)  # Intervalo onde os pontos críticos serão buscados
-pontos_criticos = encontrar_pontos_criticos(f, intervalo)
-print("Pontos críticos:", pontos_criticos)
\ No newline at end of file
+pontos_criticos, contagem = encontrar_pontos_criticos_lote(f, intervalo)
+print("Pontos críticos:", pontos_criticos)
+print("Avaliações de f:", contagem)
\ No newline at end of file
@@ -1,18 +1,60 @@
 import math
+import numpy as np
 from achar_raiz import hunt_root
 
 
-def position_falsi(a: float, b: float, max_iter: int, e: float, f = lambda x: ...):
+# Fator que multiplica o f do extremo que ficou parado duas vezes seguidas
+# (f_antigo é o f do extremo substituído, f_novo o do ponto novo)
+VARIANTES = {
+    "illinois": lambda f_antigo, f_novo: 0.5,
+    "pegasus": lambda f_antigo, f_novo: f_antigo / (f_antigo + f_novo),
+    "anderson_bjorck": lambda f_antigo, f_novo: np.where(f_novo / f_antigo < 1, 1 - f_novo / f_antigo, 0.5),
+}
+
+
+def position_falsi(a: float, b: float, max_iter: int, e: float, f = lambda x: ..., variante: str = None,
+                   retornar_iteracoes: bool = False):
+    """
+    Método da posição falsa, com as modificações Illinois, Pegasus e Anderson–Björck.
+
+    Na versão original, em funções convexas um dos extremos nunca sai do lugar e
+    a convergência fica linear e lenta. As variantes reduzem o f guardado do
+    extremo que ficou parado duas vezes seguidas, o que puxa o próximo ponto para
+    perto dele e devolve convergência superlinear. Cada iteração avalia f uma vez.
+
+    Parâmetros:
+    a, b (float): Intervalo onde está a raiz (f(a) e f(b) com sinais opostos).
+    max_iter (int): Número máximo de iterações.
+    e (float): Tolerância para |f(x)|.
+    f (função): A função f(x).
+    variante (str): None (original), "illinois", "pegasus" ou "anderson_bjorck".
+    retornar_iteracoes (bool): Se True, retorna também o número de iterações.
+
+    Retorna:
+    float: A aproximação da raiz (ou (raiz, iterações) se retornar_iteracoes=True).
+    """
+    if variante is not None and variante not in VARIANTES:
+        raise ValueError("Variante inválida. Escolha entre None, 'illinois', 'pegasus' ou 'anderson_bjorck'.")
+
     f0 = f(a)
     f1 = f(b)
+    resultado = (lambda x, k: (x, k)) if retornar_iteracoes else (lambda x, k: x)
+
+    # Um extremo já é raiz (inclusive o intervalo degenerado [x, x] do hunt_root)
+    if f0 == 0:
+        return resultado(a, 0)
+    if f1 == 0:
+        return resultado(b, 0)
 
     # Verificar se os palpites iniciais são válidos
     if f0 * f1 > 0:
-        raise "Palpites iniciais incorretos. As raízes não estão contidas no intervalo fornecido."
+        raise ValueError("Palpites iniciais incorretos. As raízes não estão contidas no intervalo fornecido.")
 
     x = 0
+    substituido = None  # Qual extremo foi trocado na iteração anterior ("a" ou "b")
+    k = 0
 
-    for _ in range(max_iter):
+    for k in range(1, max_iter + 1):
         # Calculando x2 usando o método da posição falsa
         x = a - (a - b) * f0 / (f0 - f1)
         f2 = f(x)
@@ -23,13 +65,92 @@ def position_falsi(a: float, b: float, max_iter: int, e: float, f = lambda x: ..
 
         # Atualizar os intervalos
         if f0 * f2 < 0:
+            if variante is not None and substituido == "b":
+                f0 *= VARIANTES[variante](f1, f2)  # a ficou parado de novo
             b = x
             f1 = f2
+            substituido = "b"
         else:
+            if variante is not None and substituido == "a":
+                f1 *= VARIANTES[variante](f0, f2)  # b ficou parado de novo
             a = x
             f0 = f2
+            substituido = "a"
+
+    return resultado(x, k)
+
+
+def position_falsi_batch(a, b, max_iter: int, e: float, f = lambda x, linhas: ..., variante: str = None):
+    """
+    Aplica a posição falsa (ou uma das variantes) em muitos intervalos independentes ao mesmo tempo.
+
+    f recebe os pontos das linhas ainda ativas junto com os índices dessas linhas
+    (ex.: f = lambda x, linhas: x**2 - c[linhas]). Linhas que convergem saem do
+    conjunto ativo; linhas sem mudança de sinal ficam com nan e convergiu=False.
+
+    Parâmetros:
+    a, b (array): Os intervalos de cada linha.
+    max_iter (int): Número máximo de iterações.
+    e (float): Tolerância para |f(x)|.
+    f (função): f(x, linhas), vetorizada.
+    variante (str): None (original), "illinois", "pegasus" ou "anderson_bjorck".
+
+    Retorna:
+    tuple: (raízes, iterações de cada linha, convergiu).
+    """
+    if variante is not None and variante not in VARIANTES:
+        raise ValueError("Variante inválida. Escolha entre None, 'illinois', 'pegasus' ou 'anderson_bjorck'.")
+
+    a = np.array(a, dtype=float)
+    b = np.array(b, dtype=float)
+    a, b = np.broadcast_arrays(a, b)
+    a, b = a.ravel().copy(), b.ravel().copy()
+    todas = np.arange(a.size)
 
-    return x
+    f0 = np.asarray(f(a, todas), dtype=float)
+    f1 = np.asarray(f(b, todas), dtype=float)
+    x = np.full(a.size, np.nan)
+    iteracoes = np.zeros(a.size, dtype=int)
+    # Qual extremo foi trocado na iteração anterior: 0 nenhum, 1 a, 2 b
+    substituido = np.zeros(a.size, dtype=np.int8)
+
+    # Um extremo já é raiz (inclusive intervalos degenerados [x, x])
+    x[f1 == 0] = b[f1 == 0]
+    x[f0 == 0] = a[f0 == 0]
+    convergiu = (f0 == 0) | (f1 == 0)
+    ativos = todas[~convergiu & (f0 * f1 < 0)]
+
+    for _ in range(max_iter):
+        if ativos.size == 0:
+            break
+
+        fa, fb = f0[ativos], f1[ativos]
+        novo = a[ativos] - (a[ativos] - b[ativos]) * fa / (fa - fb)
+        f2 = np.asarray(f(novo, ativos), dtype=float)
+        iteracoes[ativos] += 1
+        x[ativos] = novo
+
+        terminou = np.abs(f2) <= e
+        convergiu[ativos[terminou]] = True
+
+        troca_b = fa * f2 < 0
+        if variante is not None:
+            # O extremo que ficou parado de novo tem o f reduzido
+            fator = VARIANTES[variante]
+            parado_a = troca_b & (substituido[ativos] == 2)
+            parado_b = ~troca_b & (substituido[ativos] == 1)
+            f0[ativos[parado_a]] *= fator(fb[parado_a], f2[parado_a])
+            f1[ativos[parado_b]] *= fator(fa[parado_b], f2[parado_b])
+
+        linhas_b, linhas_a = ativos[troca_b], ativos[~troca_b]
+        b[linhas_b], f1[linhas_b] = novo[troca_b], f2[troca_b]
+        a[linhas_a], f0[linhas_a] = novo[~troca_b], f2[~troca_b]
+        substituido[linhas_b] = 2
+        substituido[linhas_a] = 1
+
+        ativos = ativos[~terminou]
+
+    return x, iteracoes, convergiu
 
 
 # EXEMPLO DE USO
@@ -39,4 +160,19 @@ def position_falsi(a: float, b: float, max_iter: int, e: float, f = lambda x: ..
 
 # for a, b in intervalos:
 #     raiz = position_falsi(a, b, 1000, 0.00001, f)
-#     print(f"A raiz encontrada no intervalo [{a},{b}] é: {raiz}")
\ No newline at end of file
+#     print(f"A raiz encontrada no intervalo [{a},{b}] é: {raiz}")
+
+# EXEMPLO DE USO (VARIANTES)
+
+# f = lambda x: x**10 - 1
+# for variante in (None, "illinois", "pegasus", "anderson_bjorck"):
+#     raiz, iteracoes = position_falsi(0, 1.3, 1000, 1e-12, f, variante, retornar_iteracoes=True)
+#     print(f"{variante}: raiz = {raiz}, iterações = {iteracoes}")
+
+# EXEMPLO DE USO (LOTE)
+
+# # x^10 = c para 100 mil valores de c, todos de uma vez
+# c = np.linspace(0.5, 2, 100000)
+# raizes, iteracoes, convergiu = position_falsi_batch(np.zeros_like(c), np.full_like(c, 1.3), 1000, 1e-12,
+#                                                     lambda x, linhas: x**10 - c[linhas], variante="illinois")
+# print(f"Convergiram: {convergiu.sum()}, iterações (máx.): {iteracoes.max()}")
@@ -1,4 +1,5 @@
 import math
+import numpy as np
 from achar_raiz import hunt_root
 
 
@@ -25,6 +26,66 @@ def secant(a: float, b: float, max_iter: int, e: float, f = lambda x: ...):
     return x
 
 
+def secant_batch(a, b, max_iter: int, e: float, f = lambda x, linhas: ...):
+    """
+    Aplica o método da secante em muitos problemas independentes ao mesmo tempo.
+
+    Cada posição (linha) dos arrays é um problema separado; f recebe os pontos das
+    linhas ainda ativas junto com os índices dessas linhas, para poder usar os
+    parâmetros de cada uma (ex.: f = lambda x, linhas: x**2 - c[linhas]).
+    Linhas que convergem saem do conjunto ativo e param de ser avaliadas.
+
+    Parâmetros:
+    a, b (array): Os dois chutes iniciais de cada linha.
+    max_iter (int): Número máximo de iterações.
+    e (float): Tolerância para |f(x)| e para |x - b|.
+    f (função): f(x, linhas), vetorizada.
+
+    Retorna:
+    tuple: (raízes, iterações de cada linha, convergiu).
+    """
+    a = np.array(a, dtype=float)
+    b = np.array(b, dtype=float)
+    a, b = np.broadcast_arrays(a, b)
+    a, b = a.ravel().copy(), b.ravel().copy()
+    todas = np.arange(a.size)
+
+    fa = np.asarray(f(a, todas), dtype=float)
+    fb = np.asarray(f(b, todas), dtype=float)
+    x = b.copy()
+    iteracoes = np.zeros(a.size, dtype=int)
+
+    convergiu = np.abs(fb) < e
+    no_a = (np.abs(fa) < e) & ~convergiu
+    x[no_a] = a[no_a]
+    convergiu |= no_a | (np.abs(b - a) < e)
+    ativos = todas[~convergiu]
+
+    for _ in range(max_iter):
+        if ativos.size == 0:
+            break
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            novo = b[ativos] - fb[ativos] / (fb[ativos] - fa[ativos]) * (b[ativos] - a[ativos])
+
+        # Secante horizontal (f(a) == f(b)): a linha não tem como continuar
+        valido = np.isfinite(novo)
+        ativos, novo = ativos[valido], novo[valido]
+
+        fx = np.asarray(f(novo, ativos), dtype=float)
+        iteracoes[ativos] += 1
+        x[ativos] = novo
+
+        terminou = (np.abs(fx) < e) | (np.abs(novo - b[ativos]) < e)
+        convergiu[ativos[terminou]] = True
+
+        a[ativos], fa[ativos] = b[ativos], fb[ativos]
+        b[ativos], fb[ativos] = novo, fx
+        ativos = ativos[~terminou]
+
+    return x, iteracoes, convergiu
+
+
 # EXEMPLO DE USO
 
 # f = lambda x: (x**math.log(x)) + x**2 + x**3 * math.sin(x)
@@ -32,4 +93,12 @@ def secant(a: float, b: float, max_iter: int, e: float, f = lambda x: ...):
 
 # for a, b in intervalos:
 #     raiz = secant(a, b, 1000, 0.00001, f)
-#     print(f"A raiz encontrada no intervalo [{a},{b}] é: {raiz}")
\ No newline at end of file
+#     print(f"A raiz encontrada no intervalo [{a},{b}] é: {raiz}")
+
+# EXEMPLO DE USO (LOTE)
+
+# # x^2 = c para 100 mil valores de c, todos de uma vez
+# c = np.linspace(1, 100, 100000)
+# raizes, iteracoes, convergiu = secant_batch(np.ones_like(c), 2 * np.ones_like(c), 100, 1e-12,
+#                                             lambda x, linhas: x**2 - c[linhas])
+# print(f"Convergiram: {convergiu.sum()}, iterações (máx.): {iteracoes.max()}")
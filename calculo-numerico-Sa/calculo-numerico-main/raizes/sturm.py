@@ -0,0 +1,304 @@
+from fractions import Fraction
+from math import gcd, lcm
+import numpy as np
+from bisseccao import bissection_batch
+from brent import brent
+from polinomios import coeficientes_crescentes, horner
+
+# Polinômios exatos como listas de Fraction (ou de inteiros) em grau crescente: [a0, a1, ..., an].
+# A cadeia de Sturm usa inteiros primitivos (sem fator comum), que crescem muito
+# menos que as frações do algoritmo de Euclides comum.
+
+
+def remover_zeros(p: list):
+    while len(p) > 1 and p[-1] == 0:
+        p = p[:-1]
+    return p
+
+
+def avaliar_exato(p: list, x):
+    """Avalia p em x (Horner) sem erro de arredondamento."""
+    x = Fraction(x)
+    resultado = Fraction(0)
+    for a in reversed(p):
+        resultado = resultado * x + a
+    return resultado
+
+
+def derivada_exata(p: list):
+    return remover_zeros([k * a for k, a in enumerate(p)][1:] or [Fraction(0)])
+
+
+def divisao_exata(p: list, d: list):
+    """Divide p por d. Retorna (quociente, resto)."""
+    resto = list(p)
+    if len(resto) < len(d):
+        return [Fraction(0)], remover_zeros(resto)
+    quociente = [Fraction(0)] * (len(resto) - len(d) + 1)
+    for k in range(len(quociente) - 1, -1, -1):
+        fator = resto[k + len(d) - 1] / d[-1]
+        quociente[k] = fator
+        for j, dj in enumerate(d):
+            resto[k + j] -= fator * dj
+    return quociente, remover_zeros(resto[:len(d) - 1] or [Fraction(0)])
+
+
+def primitiva(p: list):
+    """
+    Múltiplo inteiro positivo de p com coeficientes sem fator comum (parte primitiva).
+    Multiplicar por uma constante positiva não muda as raízes nem os sinais.
+    """
+    p = [Fraction(a) for a in p]
+    denominador = lcm(*(a.denominator for a in p))
+    inteiros = [int(a * denominador) for a in p]
+    conteudo = gcd(*inteiros) or 1
+    return [a // conteudo for a in inteiros]
+
+
+def pseudo_resto(p: list, d: list):
+    """
+    Resto de p / d multiplicado por uma constante positiva, só com inteiros.
+
+    Em cada passo o resto parcial é multiplicado por |lc(d)| antes de cancelar o
+    termo de maior grau (nada de frações) e depois reduzido à parte primitiva, o
+    que mantém os coeficientes pequenos. O sinal é o mesmo do resto verdadeiro,
+    como a cadeia de Sturm precisa.
+    """
+    resto = list(p)
+    lider = abs(d[-1])
+    sinal = 1 if d[-1] > 0 else -1
+    while len(resto) >= len(d) and resto != [0]:
+        k = len(resto) - len(d)
+        fator = resto[-1] * sinal
+        resto = [lider * a for a in resto]
+        for j, dj in enumerate(d):
+            resto[k + j] -= fator * dj
+        resto = remover_zeros(resto[:-1] or [0])
+        if resto != [0]:
+            resto = primitiva(resto)
+    return resto
+
+
+def mdc_exato(p: list, q: list):
+    """Máximo divisor comum (parte primitiva) pelo algoritmo de Euclides com pseudo-restos."""
+    p, q = primitiva(p), primitiva(q)
+    while q != [0]:
+        p, q = q, pseudo_resto(p, q)
+    return p
+
+
+def parte_livre_de_quadrados(p):
+    """
+    p / mdc(p, p'): mesmas raízes de p, todas simples.
+
+    Parâmetros:
+    p (np.poly1d ou list): O polinômio (lista em grau crescente).
+
+    Retorna:
+    list: Os coeficientes inteiros (parte primitiva) em grau crescente.
+    """
+    p = primitiva(coeficientes_crescentes(p))
+    if len(p) == 1:
+        return p
+    divisor = mdc_exato(p, derivada_exata(p))
+    if len(divisor) == 1:
+        return p
+    return primitiva(divisao_exata([Fraction(a) for a in p], divisor)[0])
+
+
+def cadeia_sturm(p):
+    """
+    Monta a sequência de Sturm p0 = q, p1 = q', p_k+1 = -resto(p_k-1 / p_k) da
+    parte livre de quadrados q de p, em aritmética exata. Cada polinômio é guardado
+    como um múltiplo inteiro positivo (primitivo), o que não altera os sinais.
+
+    Parâmetros:
+    p (np.poly1d ou list): O polinômio (lista em grau crescente, como na Vandermonde).
+
+    Retorna:
+    list: Os polinômios da cadeia.
+    """
+    cadeia = [parte_livre_de_quadrados(p)]
+    if len(cadeia[0]) == 1:
+        return cadeia
+    cadeia.append(primitiva(derivada_exata(cadeia[0])))
+    while len(cadeia[-1]) > 1:
+        resto = pseudo_resto(cadeia[-2], cadeia[-1])
+        if resto == [0]:
+            break
+        cadeia.append([-a for a in resto])
+    return cadeia
+
+
+def variacoes_de_sinal(cadeia: list, x):
+    sinais = [s for s in (avaliar_exato(p, x) for p in cadeia) if s != 0]
+    return sum(1 for s1, s2 in zip(sinais, sinais[1:]) if (s1 > 0) != (s2 > 0))
+
+
+def contar_raizes(cadeia: list, a: float, b: float):
+    """
+    Conta exatamente as raízes reais distintas do polinômio em (a, b] (teorema de Sturm).
+
+    Parâmetros:
+    cadeia (list): A saída de cadeia_sturm(p).
+    a, b (float): O intervalo, com a < b.
+
+    Retorna:
+    int: O número de raízes distintas em (a, b].
+    """
+    return variacoes_de_sinal(cadeia, a) - variacoes_de_sinal(cadeia, b)
+
+
+def cota_raizes(cadeia: list):
+    """Cota de Cauchy: toda raiz real está em (-B, B)."""
+    q = cadeia[0]
+    return float(1 + max(abs(Fraction(a, q[-1])) for a in q[:-1])) if len(q) > 1 else 1.0
+
+
+def isolar_raizes_polinomio(p, a: float = None, b: float = None):
+    """
+    Separa as raízes reais distintas do polinômio em intervalos com uma raiz cada,
+    dividindo ao meio só com base na contagem de Sturm (sem amostrar o polinômio).
+
+    Intervalos sem raiz são descartados sem nenhuma avaliação extra. Em cada
+    intervalo devolvido a parte livre de quadrados de p muda de sinal, então ele
+    pode ir direto para a bisseção ou para o método de Brent.
+
+    Parâmetros:
+    p (np.poly1d ou list): O polinômio (lista em grau crescente).
+    a, b (float): O intervalo de busca (padrão: a cota de Cauchy das raízes).
+
+    Retorna:
+    tuple: (array (N, 2) com os intervalos em ordem, cadeia de Sturm).
+    """
+    cadeia = cadeia_sturm(p)
+    q = cadeia[0]
+    cota = cota_raizes(cadeia)
+    a = Fraction(-cota if a is None else a)
+    b = Fraction(cota if b is None else b)
+    if a >= b:
+        raise ValueError("O intervalo [a, b] é inválido.")
+
+    intervalos = []
+    # Raiz exatamente em a não é contada em (a, b]
+    if avaliar_exato(q, a) == 0:
+        intervalos.append((a, a))
+
+    pilha = [(a, b, contar_raizes(cadeia, a, b))]
+    while pilha:
+        a, b, quantidade = pilha.pop()
+        if quantidade == 0:
+            continue
+        if quantidade == 1 and avaliar_exato(q, b) != 0:
+            intervalos.append((a, b))
+            continue
+        if quantidade == 1:
+            intervalos.append((b, b))  # A única raiz é o próprio b
+            continue
+
+        # Divide perto do meio, evitando cair exatamente em uma raiz
+        for t in (Fraction(1, 2), Fraction(3, 7), Fraction(4, 7), Fraction(2, 5), Fraction(3, 5)):
+            m = a + (b - a) * t
+            if avaliar_exato(q, m) != 0:
+                break
+        esquerda = contar_raizes(cadeia, a, m)
+        pilha.append((m, b, quantidade - esquerda))
+        pilha.append((a, m, esquerda))
+
+    intervalos.sort()
+    return np.array([(float(x), float(y)) for x, y in intervalos], dtype=float).reshape(-1, 2), cadeia
+
+
+def sinal_confiavel(coefs, x: float, exato):
+    """
+    Diz se p(x) calculado em ponto flutuante (Horner) tem o sinal certo: o valor
+    precisa ter o sinal do valor exato e passar da cota do erro de arredondamento
+    do Horner, 2n·eps·sum |a_k|·|x|^k.
+    """
+    fx = horner(coefs, x)[0]
+    cota = 2 * len(coefs) * np.finfo(float).eps * horner(np.abs(coefs), abs(x))[0]
+    return abs(fx) > cota and (fx > 0) == (exato > 0)
+
+
+def ajustar_intervalo(q: list, a: float, b: float, coefs):
+    """
+    Garante que o polinômio em ponto flutuante tenha o sinal certo nos extremos de [a, b].
+
+    Com raízes muito próximas o arredondamento apaga (ou inverte) a mudança de
+    sinal que existe no polinômio exato. Nesse caso o intervalo é dividido ao meio
+    usando o sinal exato de q até os dois extremos terem sinal confiável em ponto
+    flutuante ou até o intervalo chegar à resolução do ponto flutuante (aí o meio
+    já é a raiz).
+
+    Parâmetros:
+    q (list): O polinômio exato (parte livre de quadrados, grau crescente).
+    a, b (float): Um intervalo com exatamente uma raiz de q.
+    coefs (array): Os coeficientes de q em ponto flutuante.
+
+    Retorna:
+    tuple: (a, b) com mudança de sinal confiável, ou (r, r) com a raiz r já encontrada.
+    """
+    a, b = Fraction(a), Fraction(b)
+    valor_a, valor_b = avaliar_exato(q, a), avaliar_exato(q, b)
+    while not (sinal_confiavel(coefs, float(a), valor_a) and sinal_confiavel(coefs, float(b), valor_b)):
+        m = (a + b) / 2
+        if float(m) in (float(a), float(b)):
+            return float(m), float(m)
+        valor = avaliar_exato(q, m)
+        if valor == 0:
+            return float(m), float(m)
+        if (valor > 0) == (valor_a > 0):
+            a, valor_a = m, valor
+        else:
+            b, valor_b = m, valor
+    return float(a), float(b)
+
+
+def raizes_reais_sturm(p, a: float = None, b: float = None, metodo: str = "brent", max_iter: int = 200,
+                       e: float = 1e-14):
+    """
+    Encontra todas as raízes reais distintas do polinômio: isola com Sturm e refina
+    cada intervalo com Brent ou com a bisseção em lote.
+
+    Parâmetros:
+    p (np.poly1d ou list): O polinômio (lista em grau crescente).
+    a, b (float): O intervalo de busca (padrão: a cota de Cauchy das raízes).
+    metodo (str): "brent" ou "bisseccao".
+    max_iter (int): Número máximo de iterações do método escolhido.
+    e (float): Tolerância do método escolhido.
+
+    Retorna:
+    array: As raízes reais distintas, em ordem crescente.
+    """
+    intervalos, cadeia = isolar_raizes_polinomio(p, a, b)
+    # Dividir pelo coeficiente líder evita overflow na conversão de inteiros grandes
+    coefs = np.array([float(Fraction(c, cadeia[0][-1])) for c in cadeia[0]])
+    f = lambda x: horner(coefs, x)[0]
+
+    # A contagem é exata, então o array de saída já nasce com o tamanho certo
+    raizes = np.empty(len(intervalos))
+    for i, (x, y) in enumerate(intervalos):
+        if x != y:
+            intervalos[i] = ajustar_intervalo(cadeia[0], x, y, coefs)
+    exatas = intervalos[:, 0] == intervalos[:, 1]
+    raizes[exatas] = intervalos[exatas, 0]
+
+    if metodo == "brent":
+        for i in np.flatnonzero(~exatas):
+            raizes[i] = brent(intervalos[i, 0], intervalos[i, 1], max_iter, e, f)
+    elif metodo == "bisseccao":
+        raizes[~exatas] = bissection_batch(intervalos[~exatas], max_iter, e, f)[0]
+    else:
+        raise ValueError("Método inválido. Escolha entre 'brent' ou 'bisseccao'.")
+    return raizes
+
+
+# EXEMPLO DE USO
+
+# # Raízes 1, ..., 8, uma raiz dupla em 0.5 e duas raízes próximas (3 e 3.0078125)
+# p = np.poly1d(np.arange(1, 9), r=True) * np.poly1d([0.5, 0.5, 3.0078125], r=True)
+# cadeia = cadeia_sturm(p)
+# print("Raízes distintas em (2.5, 3.5]:", contar_raizes(cadeia, 2.5, 3.5))
+# intervalos, _ = isolar_raizes_polinomio(p)
+# print(intervalos)
+# print(raizes_reais_sturm(p))
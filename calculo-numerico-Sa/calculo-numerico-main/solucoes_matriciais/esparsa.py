@@ -0,0 +1,198 @@
+import numpy as np
+
+
+class MatrizCSR:
+    """
+    Matriz esparsa no formato CSR (linhas comprimidas): só os elementos não nulos
+    são guardados.
+
+    Os valores da linha i estão em data[indptr[i]:indptr[i+1]] e as colunas
+    correspondentes em indices[indptr[i]:indptr[i+1]]. Assim o produto A @ x e as
+    iterações de Jacobi e Gauss-Seidel custam O(nnz) em vez de O(n²).
+
+    Parâmetros:
+    data (array): Os valores não nulos, linha por linha.
+    indices (array): A coluna de cada valor.
+    indptr (array): Onde começa cada linha em data (tamanho n_linhas + 1).
+    forma (tuple): (n_linhas, n_colunas).
+    """
+
+    def __init__(self, data, indices, indptr, forma: tuple):
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.forma = tuple(forma)
+        if len(self.indptr) != self.forma[0] + 1:
+            raise ValueError("indptr deve ter n_linhas + 1 elementos.")
+        # Linha de cada elemento guardado (usada no produto vetorizado)
+        self.linhas = np.repeat(np.arange(self.forma[0]), np.diff(self.indptr))
+
+    @classmethod
+    def de_triplas(cls, linhas, colunas, valores, forma: tuple = None):
+        """
+        Monta a matriz a partir de triplas (i, j, a_ij), em qualquer ordem.
+        Triplas repetidas para a mesma posição são somadas e zeros são descartados.
+
+        Parâmetros:
+        linhas, colunas (array): Os índices de cada elemento.
+        valores (array): Os valores de cada elemento.
+        forma (tuple): (n_linhas, n_colunas) (padrão: o menor que comporta os índices).
+
+        Retorna:
+        MatrizCSR: A matriz.
+        """
+        linhas = np.asarray(linhas, dtype=np.int64)
+        colunas = np.asarray(colunas, dtype=np.int64)
+        valores = np.asarray(valores, dtype=float)
+        if forma is None:
+            forma = (int(linhas.max(initial=-1)) + 1, int(colunas.max(initial=-1)) + 1)
+
+        # Ordena por linha e depois por coluna, somando posições repetidas
+        chaves = linhas * forma[1] + colunas
+        chaves, posicao = np.unique(chaves, return_inverse=True)
+        somados = np.bincount(posicao, weights=valores, minlength=chaves.size)
+
+        nao_nulos = somados != 0
+        chaves, somados = chaves[nao_nulos], somados[nao_nulos]
+        linhas, colunas = np.divmod(chaves, forma[1])
+
+        indptr = np.zeros(forma[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(linhas, minlength=forma[0]), out=indptr[1:])
+        return cls(somados, colunas, indptr, forma)
+
+    @classmethod
+    def de_densa(cls, A):
+        """Converte uma matriz densa (lista de listas ou array) para CSR."""
+        A = np.asarray(A, dtype=float)
+        linhas, colunas = np.nonzero(A)
+        return cls.de_triplas(linhas, colunas, A[linhas, colunas], A.shape)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def __matmul__(self, x):
+        # Produto matriz-vetor: cada elemento guardado contribui data·x[coluna] na sua linha
+        x = np.asarray(x, dtype=float)
+        return np.bincount(self.linhas, weights=self.data * x[self.indices], minlength=self.forma[0])
+
+    def diagonal(self):
+        d = np.zeros(min(self.forma))
+        na_diagonal = self.linhas == self.indices
+        d[self.linhas[na_diagonal]] = self.data[na_diagonal]
+        return d
+
+    def densa(self):
+        A = np.zeros(self.forma)
+        A[self.linhas, self.indices] = self.data
+        return A
+
+
+def carregar_triplas(caminho: str, forma: tuple = None):
+    """
+    Lê uma matriz esparsa de um arquivo texto com uma tripla "i j valor" por linha.
+
+    Parâmetros:
+    caminho (str): O arquivo.
+    forma (tuple): (n_linhas, n_colunas) (padrão: deduzida dos índices).
+
+    Retorna:
+    MatrizCSR: A matriz.
+    """
+    triplas = np.loadtxt(caminho, ndmin=2)
+    return MatrizCSR.de_triplas(triplas[:, 0].astype(np.int64), triplas[:, 1].astype(np.int64), triplas[:, 2], forma)
+
+
+def erro_relativo(xk, x):
+    # Mesmo critério do gauss_jacobi: max|x_k+1 - x_k| / max|x_k+1|
+    return np.max(np.abs(xk - x)) / max(np.max(np.abs(xk)), np.finfo(float).tiny)
+
+
+def jacobi_csr(A: MatrizCSR, b, x=None, erro: float = 1e-8, max_iter: int = 1000):
+    """
+    Método de Jacobi sobre uma matriz CSR: x_k+1 = (b - (A - D)x_k) / D.
+    Cada iteração é um produto esparso (O(nnz)), todo vetorizado.
+
+    Parâmetros:
+    A (MatrizCSR): A matriz do sistema (diagonal sem zeros).
+    b (array): O vetor independente.
+    x (array): Chute inicial (padrão: zeros).
+    erro (float): Tolerância para o erro relativo entre iterações.
+    max_iter (int): Número máximo de iterações.
+
+    Retorna:
+    tuple: (solução, número de iterações).
+    """
+    b = np.asarray(b, dtype=float)
+    x = np.zeros(A.forma[0]) if x is None else np.array(x, dtype=float)
+    D = A.diagonal()
+    if np.any(D == 0):
+        raise ValueError("A diagonal da matriz tem zeros, o método de Jacobi não se aplica.")
+
+    for k in range(1, max_iter + 1):
+        xk = (b - (A @ x - D * x)) / D
+        if erro_relativo(xk, x) < erro:
+            return xk, k
+        x = xk
+
+    return x, max_iter
+
+
+def gauss_seidel_csr(A: MatrizCSR, b, x=None, erro: float = 1e-8, max_iter: int = 1000):
+    """
+    Método de Gauss-Seidel sobre uma matriz CSR.
+
+    A varredura é sequencial (cada x_i usa os x_j já atualizados), mas em cada
+    linha só os elementos não nulos entram na soma, então uma iteração custa O(nnz).
+
+    Parâmetros:
+    A (MatrizCSR): A matriz do sistema (diagonal sem zeros).
+    b (array): O vetor independente.
+    x (array): Chute inicial (padrão: zeros).
+    erro (float): Tolerância para o erro relativo entre iterações.
+    max_iter (int): Número máximo de iterações.
+
+    Retorna:
+    tuple: (solução, número de iterações).
+    """
+    b = np.asarray(b, dtype=float)
+    x = np.zeros(A.forma[0]) if x is None else np.array(x, dtype=float)
+    D = A.diagonal()
+    if np.any(D == 0):
+        raise ValueError("A diagonal da matriz tem zeros, o método de Gauss-Seidel não se aplica.")
+
+    # Listas do Python são mais rápidas que fatias pequenas de arrays no laço por linha
+    data, indices, indptr = A.data.tolist(), A.indices.tolist(), A.indptr.tolist()
+    b_lista, D_lista = b.tolist(), D.tolist()
+
+    for k in range(1, max_iter + 1):
+        x_antigo = x
+        x = x.tolist()
+        for i in range(A.forma[0]):
+            soma = 0.0
+            for p in range(indptr[i], indptr[i + 1]):
+                soma += data[p] * x[indices[p]]
+            # A soma incluiu o termo da diagonal, que é descontado aqui
+            x[i] = (b_lista[i] - soma + D_lista[i] * x[i]) / D_lista[i]
+        x = np.array(x)
+
+        if erro_relativo(x, x_antigo) < erro:
+            return x, k
+
+    return x, max_iter
+
+
+# EXEMPLO DE USO
+
+# # Laplaciano 1D (tridiagonal) com n = 100000 a partir de triplas
+# n = 100000
+# i = np.arange(n)
+# linhas = np.concatenate((i, i[1:], i[:-1]))
+# colunas = np.concatenate((i, i[1:] - 1, i[:-1] + 1))
+# valores = np.concatenate((4 * np.ones(n), -np.ones(n - 1), -np.ones(n - 1)))
+# A = MatrizCSR.de_triplas(linhas, colunas, valores, (n, n))
+# b = A @ np.ones(n)
+# x, k = jacobi_csr(A, b, erro=1e-10)
+# print(f"Jacobi: {k} iterações, erro máximo {np.abs(x - 1).max()}")
+# x, k = gauss_seidel_csr(A, b, erro=1e-10)
+# print(f"Gauss-Seidel: {k} iterações, erro máximo {np.abs(x - 1).max()}")
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def gauss(A: list, b: list):
     n = len(b) - 1
     x = []
@@ -29,49 +32,164 @@ def identity(N):
     return I
 
 
-def lu(A: list):
+def lu_rank1(A):
+    """
+    Fatoração LU com pivoteamento parcial usando arrays do NumPy.
+
+    Cada passo k troca as linhas de uma vez e atualiza a submatriz restante com
+    uma única operação (atualização de posto 1), em vez de três laços em Python.
+
+    Parâmetros:
+    A (list ou array): Matriz quadrada n x n (não é alterada).
+
+    Retorna:
+    tuple: (LU, piv). LU guarda U na parte triangular superior e os multiplicadores
+    de L abaixo da diagonal; piv é o vetor de permutação (PA = LU com P = I[piv]).
+    """
+    A = np.array(A, dtype=float)
     n = len(A)
-    p = identity(n)
+    piv = np.arange(n)
 
     for k in range(n):
-        pivot = abs(A[k][k])
-        r = k
-        
-        for i in range(k + 1, n):
-            if abs(A[i][k]) > pivot:
-                pivot = abs(A[i][k])
-                r = i
-        
-        if pivot == 0:
-            raise "A MATRIZ É SINGULAR"
-        
+        r = k + np.argmax(np.abs(A[k:, k]))
+        if A[r, k] == 0:
+            raise ValueError("A MATRIZ É SINGULAR")
+
         if r != k:
-            aux = p[k]
-            p[k] = p[r]
-            p[r] = aux
-            for j in range(n):
-                aux = A[k][j]
-                A[k][j] = A[r][j]
-                A[r][j] = aux
+            A[[k, r]] = A[[r, k]]
+            piv[[k, r]] = piv[[r, k]]
+
+        A[k + 1:, k] /= A[k, k]
+        A[k + 1:, k + 1:] -= np.outer(A[k + 1:, k], A[k, k + 1:])
+
+    return A, piv
+
+
+def lu_blocado(A, tamanho_bloco: int = 64):
+    """
+    Fatoração LU com pivoteamento parcial, por blocos (right-looking).
+
+    Cada faixa de tamanho_bloco colunas é fatorada com atualizações de posto 1;
+    depois a parte de U à direita da faixa sai de uma substituição progressiva e o
+    resto da matriz é atualizado com um único produto de matrizes (A22 -= L21 @ U12),
+    que é onde está quase todo o trabalho e roda no BLAS.
+
+    Parâmetros:
+    A (list ou array): Matriz quadrada n x n (não é alterada).
+    tamanho_bloco (int): Número de colunas por faixa.
+
+    Retorna:
+    tuple: (LU, piv), no mesmo formato de lu_rank1.
+    """
+    A = np.array(A, dtype=float)
+    n = len(A)
+    piv = np.arange(n)
+
+    for inicio in range(0, n, tamanho_bloco):
+        fim = min(inicio + tamanho_bloco, n)
+
+        # Fatora a faixa de colunas [inicio, fim)
+        for k in range(inicio, fim):
+            r = k + np.argmax(np.abs(A[k:, k]))
+            if A[r, k] == 0:
+                raise ValueError("A MATRIZ É SINGULAR")
+
+            if r != k:
+                A[[k, r]] = A[[r, k]]
+                piv[[k, r]] = piv[[r, k]]
+
+            A[k + 1:, k] /= A[k, k]
+            A[k + 1:, k + 1:fim] -= np.outer(A[k + 1:, k], A[k, k + 1:fim])
+
+        if fim == n:
+            break
+
+        # U12 = L11^-1 A12
+        for i in range(inicio + 1, fim):
+            A[i, fim:] -= A[i, inicio:i] @ A[inicio:i, fim:]
+
+        # Atualização do restante da matriz com um produto de matrizes
+        A[fim:, fim:] -= A[fim:, inicio:fim] @ A[inicio:fim, fim:]
+
+    return A, piv
+
+
+def substituicao_progressiva(LU, b, tamanho_bloco: int = 64):
+    """
+    Resolve Ly = b (L com diagonal unitária, guardada abaixo da diagonal de LU).
+
+    b pode ter várias colunas. As linhas são processadas em blocos: a contribuição
+    dos blocos anteriores entra com um produto de matrizes e só o bloco atual é
+    resolvido linha a linha.
+    """
+    y = np.array(b, dtype=float)
+    n = len(LU)
+    for inicio in range(0, n, tamanho_bloco):
+        fim = min(inicio + tamanho_bloco, n)
+        y[inicio:fim] -= LU[inicio:fim, :inicio] @ y[:inicio]
+        for i in range(inicio + 1, fim):
+            y[i] -= LU[i, inicio:i] @ y[inicio:i]
+    return y
 
-        for i in range(k + 1, n):
-            m = A[i][k] / A[k][k]
-            A[i][k] = m
-            for j in range(k + 1, n):
-                A[i][j] -= m * A[k][j]
 
-    return A, p
+def substituicao_regressiva(LU, y, tamanho_bloco: int = 64):
+    """Resolve Ux = y (U na parte triangular superior de LU), em blocos como a progressiva."""
+    x = np.array(y, dtype=float)
+    n = len(LU)
+    for fim in range(n, 0, -tamanho_bloco):
+        inicio = max(fim - tamanho_bloco, 0)
+        x[inicio:fim] -= LU[inicio:fim, fim:] @ x[fim:]
+        for i in range(fim - 1, inicio - 1, -1):
+            x[i] = (x[i] - LU[i, i + 1:fim] @ x[i + 1:fim]) / LU[i, i]
+    return x
+
+
+class FatoracaoLU:
+    """
+    Fatoração LU reaproveitável: A é fatorada uma vez e depois resolve quantos
+    sistemas Ax = b forem necessários, cada um em O(n²) em vez de O(n³).
+
+    Guarda L e U juntas numa única matriz (L abaixo da diagonal, com diagonal
+    unitária implícita, e U no resto) e o vetor de pivôs (PA = LU com P = I[piv]).
+
+    Parâmetros:
+    A (list ou array): Matriz quadrada n x n.
+    tamanho_bloco (int): Tamanho do bloco usado em lu_blocado.
+    """
+
+    def __init__(self, A, tamanho_bloco: int = 64):
+        self.LU, self.piv = lu_blocado(A, tamanho_bloco)
+
+    def solve(self, B):
+        """
+        Resolve AX = B.
+
+        Parâmetros:
+        B (list ou array): Um vetor de tamanho n ou uma matriz (n, k) com k lados direitos.
+
+        Retorna:
+        array: A solução, com o mesmo formato de B.
+        """
+        B = np.asarray(B, dtype=float)
+        if B.shape[0] != len(self.LU):
+            raise ValueError("O número de linhas de B não bate com a ordem da matriz.")
+        # Todas as colunas de B são substituídas juntas, linha a linha
+        y = substituicao_progressiva(self.LU, B[self.piv])
+        return substituicao_regressiva(self.LU, y)
+
+    resolver = solve
+
+
+def lu(A: list):
+    # Retorna a matriz fatorada e o vetor de pivôs p (PA = LU com P = I[p]);
+    # a permutação não é montada como matriz n x n
+    A_fatorada, p = lu_rank1(A)
+    return A_fatorada, p
 
 
 def resolucao_Pb(p: list, b: list):
-    n = len(p)
-    Pb = []
-    for i in range(n):
-        line = 0
-        for j in range(n):
-            line += p[i][j] * b[j]
-        Pb.append(line)
-    return Pb
+    # Pb a partir do vetor de pivôs: a linha i de Pb é b[p[i]]
+    return [b[i] for i in p]
 
 
 def resolucao_y(Lower, Pb):
@@ -97,20 +215,23 @@ def divide_matriz(A: list):
     return Upper, Lower
 
 
-def resolver_sistema_lu(A: list, b: list):
-    # 1. Fatoração LU com pivoteamento
-    A_fatorada, p = lu(A)
-    
-    # 2. Divide a matriz fatorada em L e U
-    Upper, Lower = divide_matriz(A_fatorada)
-    
-    # 3. Resolve Pb
-    Pb = resolucao_Pb(p, b)
-    
-    # 4. Resolve Ly = Pb
-    y = resolucao_y(Lower, Pb)
-    
-    # 5. Resolve Ux = y
-    x = gauss(Upper, y)
-    
-    return x
+def resolver_sistema_lu(A: list, b: list, tamanho_bloco: int = 64):
+    # Para resolver vários sistemas com a mesma A, use FatoracaoLU(A).solve(B) direto
+    # 1. Fatoração LU com pivoteamento (por blocos, com NumPy)
+    fatoracao = FatoracaoLU(A, tamanho_bloco)
+
+    # 2. Resolve Ly = Pb e Ux = y (Pb é só b reordenado pelos pivôs)
+    x = fatoracao.solve(b)
+
+    return x.tolist()
+
+
+# EXEMPLO DE USO
+
+# A = [[2, 1, 1], [4, -6, 0], [-2, 7, 2]]
+# print(resolver_sistema_lu(A, [5, -2, 9]))
+
+# # Mesma A, vários lados direitos: fatora uma vez só
+# fatoracao = FatoracaoLU(A)
+# B = np.array([[5, 1], [-2, 0], [9, 3]])
+# print(fatoracao.solve(B))
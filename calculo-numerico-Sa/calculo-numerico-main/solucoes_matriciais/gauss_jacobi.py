@@ -10,6 +10,13 @@ b = np.array([7, -8, 6])
 x = [0, 0, 0]
 
 def gauss_jacobi(A: list, b: list, x: list, erro: float, max_iter: int):
+    # Matriz esparsa (MatrizCSR de esparsa.py): cada iteração percorre só os não nulos,
+    # O(nnz) em vez de O(n²). A importação fica aqui dentro para o arquivo continuar
+    # rodando direto da sua pasta
+    if hasattr(A, "indptr"):
+        from solucoes_matriciais.esparsa import jacobi_csr
+        return jacobi_csr(A, b, x, erro, max_iter)[0]
+
     linha, coluna = A.shape
     H = np.zeros((linha, coluna))
     g = np.zeros(coluna)
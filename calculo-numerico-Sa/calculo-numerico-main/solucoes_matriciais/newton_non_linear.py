@@ -1,13 +1,14 @@
 import numpy as np
 import math
 
-def non_linear_newton(chutes: list, F: list, J: list, max_iter: int, tol=1e-6):
+def non_linear_newton(chutes: list, F: list, J: list = None, max_iter: int = 100, tol=1e-6):
     """
     Método de Newton para sistemas de equações não lineares.
     
     :param chutes: Lista de chutes iniciais para as variáveis [x1, x2, ..., xn]
     :param F: Lista de funções não lineares [f1, f2, ..., fn]
     :param J: Lista de listas representando a matriz jacobiana J[i][j]
+              (None para calcular a jacobiana exata com números duais)
     :param max_iter: Número máximo de iterações
     :param tol: Tolerância para convergência
     :return: Aproximação da solução
@@ -16,12 +17,18 @@ def non_linear_newton(chutes: list, F: list, J: list, max_iter: int, tol=1e-6):
     x = np.array(chutes, dtype=float)  # Converter chutes para um array NumPy
 
     for _ in range(max_iter):
-        # Resolve cada função de F no ponto x_k
-        F_eval = np.array([f(*x) for f in F], dtype=float)
+        if J is None:
+            # Importado só aqui para o caminho com J explícita rodar sem o pacote raizes
+            from raizes.dual import jacobiana
+            # F(x_k) e a jacobiana exata saem das mesmas avaliações com números duais
+            F_eval, J_eval = jacobiana(lambda v: [f(*v) for f in F], x)
+        else:
+            # Resolve cada função de F no ponto x_k
+            F_eval = np.array([f(*x) for f in F], dtype=float)
 
-        # Preenchimento da matriz jacobiana com o resulatdo de cada função derivada no ponto x_k.
-        J_eval = np.array([[J[i][j](*x) if callable(J[i][j]) else J[i][j] 
-                            for j in range(len(x))] for i in range(len(F))], dtype=float)
+            # Preenchimento da matriz jacobiana com o resulatdo de cada função derivada no ponto x_k.
+            J_eval = np.array([[J[i][j](*x) if callable(J[i][j]) else J[i][j] 
+                                for j in range(len(x))] for i in range(len(F))], dtype=float)
 
         # Resolver o sistema J(x) * Δx = -F(x)
         try:
@@ -62,3 +69,11 @@ def non_linear_newton(chutes: list, F: list, J: list, max_iter: int, tol=1e-6):
 # solucao = non_linear_newton(chutes, F, J, max_iter=10)
 
 # print("Solução aproximada:", solucao)
+
+# # Sem a jacobiana: escrever F com as funções do NumPy (np.cos, np.exp, ...) em vez do math
+# F = [
+#     lambda x1, x2, x3: 3*x1 - np.cos(x2*x3) - 0.5,
+#     lambda x1, x2, x3: (x1**2) - 81*((x2+0.1)**2) + np.sin(x3) + 1.06,
+#     lambda x1, x2, x3: np.exp(-x1*x2) + 20*x3 + (10*math.pi - 3)/3
+# ]
+# solucao = non_linear_newton(chutes, F, max_iter=10)
@@ -0,0 +1,43 @@
+import time
+import numpy as np
+
+from solucoes_matriciais.fatoracao_lu import lu_rank1, lu_blocado, resolver_sistema_lu
+
+
+### BENCHMARK DA FATORAÇÃO LU ###
+# Tempo de fatoração para n crescente. A versão de posto 1 faz n atualizações da
+# submatriz inteira, então fica limitada pela memória; a blocada passa quase todo o
+# trabalho para produtos de matrizes. A versão de posto 1 só roda até MAX_N_RANK1
+# porque acima disso leva minutos.
+
+TAMANHOS = [100, 250, 500, 1000, 2000, 4000]
+MAX_N_RANK1 = 2000
+TAMANHO_BLOCO = 64
+
+rng = np.random.default_rng(0)
+
+print('| {:^6} | {:^12} | {:^12} | {:^12} | {:^10} |'.format("n", "posto 1 (s)", "blocada (s)", "numpy (s)", "resíduo"))
+for n in TAMANHOS:
+    A = rng.normal(size=(n, n))
+    b = rng.normal(size=n)
+
+    if n <= MAX_N_RANK1:
+        inicio = time.perf_counter()
+        lu_rank1(A)
+        tempo_rank1 = '{:12.4f}'.format(time.perf_counter() - inicio)
+    else:
+        tempo_rank1 = '{:>12}'.format("-")
+
+    inicio = time.perf_counter()
+    lu_blocado(A, TAMANHO_BLOCO)
+    tempo_blocado = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    np.linalg.solve(A, b)
+    tempo_numpy = time.perf_counter() - inicio
+
+    # Resíduo relativo da solução completa (fatoração + substituições)
+    x = np.array(resolver_sistema_lu(A, b, TAMANHO_BLOCO))
+    residuo = np.linalg.norm(A @ x - b) / (np.linalg.norm(A) * np.linalg.norm(x))
+
+    print('| {:6} | {} | {:12.4f} | {:12.4f} | {:10.2e} |'.format(n, tempo_rank1, tempo_blocado, tempo_numpy, residuo))
@@ -0,0 +1,22 @@
+import numpy as np
+
+from raizes.polinomios import raizes_polinomio
+
+
+### RAÍZES MÚLTIPLAS ###
+# O polimento de Newton não pode estragar raízes múltiplas que já saíram exatas:
+# perto delas p e p' estão no nível do arredondamento e o passo p/p' é só ruído.
+# Uma raiz de multiplicidade m só é determinada até ~eps^(1/m), daí as tolerâncias.
+
+CASOS = [
+    ("(x - 1)²", [1, -2, 1], [1, 1], 1e-7),
+    ("(x - 2)²", [4, -4, 1], [2, 2], 1e-7),
+    ("(x - 1)³(x - 2)", np.poly1d([1, 1, 1, 2], r=True), [1, 1, 1, 2], 1e-4),
+]
+
+for metodo in ("companheira", "aberth", "deflacao"):
+    for nome, p, esperadas, tol in CASOS:
+        raizes = raizes_polinomio(p, metodo=metodo)
+        erro = np.abs(np.sort(raizes.real) - esperadas).max()
+        print(f"{metodo:12} {nome:16} erro máximo = {erro:.2e}")
+        assert erro < tol, f"{metodo}: raízes de {nome} erradas: {raizes}"
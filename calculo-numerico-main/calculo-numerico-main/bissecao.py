@@ -1,9 +1,12 @@
 
+from rastro import Rastro
 
-def bissecao(f, a, b, tol=1e-2, max_iter=100):
+
+def bissecao(f, a, b, tol=1e-2, max_iter=100, rastro=None):
     iteracoes = 0
+    fa = f(a)
     
-    if (f(a) * f(b) > 0):
+    if (fa * f(b) > 0):
         return None, 0
 
     while iteracoes < max_iter:
@@ -14,13 +17,15 @@ def bissecao(f, a, b, tol=1e-2, max_iter=100):
         erro_absoluto = abs(b - a)
         erro_relativo = erro_absoluto / abs(b)
 
-        print('| {:10} | {:<20} | {:<25} | {:<25} | {:<25} | {:<25}|'.format(iteracoes, pontoMedio, f(a), f(b), erro_absoluto, erro_relativo))
+        if rastro is not None:
+            rastro.registrar(iteracoes, pontoMedio, f_pontoMedio, erro_absoluto, erro_relativo)
 
         if erro_relativo < tol:
             return pontoMedio, iteracoes
         
-        if (f(a) * f_pontoMedio > 0):
+        if (fa * f_pontoMedio > 0):
             a = pontoMedio
+            fa = f_pontoMedio
         else:
             b = pontoMedio
         iteracoes += 1
@@ -37,9 +42,10 @@ a = 2.0
 b = 3.0
 
 print("Método de Bisseção")
-print('| {:^10} | {:^20} | {:^25} | {:^25} | {:^25} | {:^25}|'.format("iteracoes", "pontoMedio", "f(a)", "f(b)", "erro_absoluto", "erro_relativo"))
 
-raiz, iteracoes = bissecao(f, a, b)
+rastro = Rastro()
+raiz, iteracoes = bissecao(f, a, b, rastro=rastro)
+print(rastro.tabela())
 
 if raiz is not None:
     print("Convergiu em ", iteracoes, " para ", raiz)
@@ -1,16 +1,17 @@
 
+from rastro import Rastro
 
-def falsa_posicao(f, a, b, tol=1e-3, max_iter=100):
+
+def falsa_posicao(f, a, b, tol=1e-3, max_iter=100, rastro=None):
     iteracoes = 0
+    fa = f(a)
+    fb = f(b)
     
-    if (f(a) * f(b) > 0):
+    if (fa * fb > 0):
         return None, 0
 
     while iteracoes < max_iter:
         
-        fa = f(a)
-        fb = f(b)
-        
         pontoMedio = (a*fb - b*fa) / (fb - fa)
         
         f_pontoMedio = f(pontoMedio)
@@ -18,15 +19,18 @@ def falsa_posicao(f, a, b, tol=1e-3, max_iter=100):
         erro_absoluto = abs(b - a)
         erro_relativo = erro_absoluto / abs(b)
 
-        print('| {:10} | {:<20} | {:<25} | {:<25} | {:<25} | {:<25}|'.format(iteracoes, pontoMedio, f(a), f(b), erro_absoluto, erro_relativo))
+        if rastro is not None:
+            rastro.registrar(iteracoes, pontoMedio, f_pontoMedio, erro_absoluto, erro_relativo)
 
         if erro_relativo < tol:
             return pontoMedio, iteracoes
         
         if (fa * f_pontoMedio > 0):
             a = pontoMedio
+            fa = f_pontoMedio
         else:
             b = pontoMedio
+            fb = f_pontoMedio
         iteracoes += 1
     return pontoMedio, iteracoes
 
@@ -40,8 +44,9 @@ a = 2.0
 b = 3.0
 
 print("Método de Falsa Posição")
-print('| {:^10} | {:^20} | {:^25} | {:^25} | {:^25} | {:^25}|'.format("iteracoes", "pontoMedio", "f(a)", "f(b)", "erro_absoluto", "erro_relativo"))
 
-raiz, iteracoes = falsa_posicao(f, a, b)
+rastro = Rastro()
+raiz, iteracoes = falsa_posicao(f, a, b, rastro=rastro)
+print(rastro.tabela())
 
 print("Convergiu em ", iteracoes, " iterações para ", raiz)
@@ -17,8 +17,17 @@ def ler_matriz_de_arquivo():
 
 
 
+def fora_da_diagonal(matriz):
+    # Para cada linha, só os pares (j, a_ij) não nulos fora da diagonal.
+    # Assim cada iteração custa O(nnz) em vez de O(n²) em matrizes esparsas.
+    n = len(matriz)
+    return [[(j, matriz[i][j]) for j in range(n) if j != i and matriz[i][j] != 0] for i in range(n)]
+
+
+
 def gauss_seidel(matriz, b, epsilon=1e-5, max_iter=100):
     n = len(matriz)
+    linhas = fora_da_diagonal(matriz)
     x = np.zeros(n)
     diferenca_relativa = np.inf
     iteracao = 0
@@ -27,7 +36,7 @@ def gauss_seidel(matriz, b, epsilon=1e-5, max_iter=100):
         x_antigo = np.copy(x)
         
         for i in range(n):
-            soma = sum(matriz[i][j] * x[j] for j in range(n) if j != i)
+            soma = sum(a_ij * x[j] for j, a_ij in linhas[i])
             x[i] = (b[i] - soma) / matriz[i][i]
         
         diferenca_relativa = np.max(np.abs(x - x_antigo) / np.abs(x))
@@ -42,6 +51,7 @@ def gauss_seidel(matriz, b, epsilon=1e-5, max_iter=100):
 
 def jacobi(matriz, b, epsilon=1e-5, max_iter=100):
     n = len(matriz)
+    linhas = fora_da_diagonal(matriz)
     x = np.zeros(n)
     x_antigo = np.zeros(n)
     diferenca_relativa = np.inf
@@ -49,7 +59,7 @@ def jacobi(matriz, b, epsilon=1e-5, max_iter=100):
 
     while diferenca_relativa > epsilon and iteracao < max_iter:
         for i in range(n):
-            soma = sum(matriz[i][j] * x_antigo[j] for j in range(n) if j != i)
+            soma = sum(a_ij * x_antigo[j] for j, a_ij in linhas[i])
             x[i] = (b[i] - soma) / matriz[i][i]
 
         diferenca_relativa = np.max(np.abs(x - x_antigo) / np.abs(x))
@@ -1,19 +1,24 @@
 
+from rastro import Rastro
 
-def newton_raphson(f, df, x0, tol=1e-6, max_iter=100):
+
+def newton_raphson(f, df, x0, tol=1e-6, max_iter=100, rastro=None):
 
     x = x0
+    fx = f(x)
     iteracoes = 0
 
     while iteracoes < max_iter:
         iteracoes += 1
         
-        x_next = x - f(x) / df(x)
+        x_next = x - fx / df(x)
+        fx = f(x_next)
 
         erro_absoluto = abs(x_next - x)
         erro_relativo = erro_absoluto / abs(x_next)
 
-        print('| {:10} | {:<20} | {:<25} | {:<25} | {:<25} | {:<25}|'.format(iteracoes, x_next, f(x_next), df(x_next), erro_absoluto, erro_relativo))
+        if rastro is not None:
+            rastro.registrar(iteracoes, x_next, fx, erro_absoluto, erro_relativo)
 
         if erro_relativo < tol:
             return x_next, iteracoes
@@ -34,9 +39,10 @@ def df(x):
 x0 = 1
 
 print("Método de Newton-Raphson")
-print('| {:10} | {:<20} | {:<25} | {:<25} | {:<25} | {:<25}|'.format("iteracoes", "x_next", "x_prev", "f(x)", "erro_absoluto", "erro_relativo"))
 
-raiz, iteracoes = newton_raphson(f, df, x0, 1e-5)
+rastro = Rastro()
+raiz, iteracoes = newton_raphson(f, df, x0, 1e-5, rastro=rastro)
+print(rastro.tabela())
 
 if raiz is not None:
     print("Convergiu em ", iteracoes, " para ", raiz)
@@ -1,26 +1,32 @@
 
+from rastro import Rastro
 
-def quase_newton(f, x0, x1, tol=1e-6, max_iter=100):
+
+def quase_newton(f, x0, x1, tol=1e-6, max_iter=100, rastro=None):
     x_prev = x0
     x = x1
+    f_prev = f(x_prev)
+    fx = f(x)
     iteracoes = 0
     
     while iteracoes < max_iter:
         iteracoes += 1
         
-        aproximacao_derivada = ( f(x + (x_prev - x)) - f(x) ) / (x_prev - x)
-        x_next = x - f(x) / aproximacao_derivada
+        aproximacao_derivada = ( f_prev - fx ) / (x_prev - x)
+        x_next = x - fx / aproximacao_derivada
+        f_next = f(x_next)
 
         erro_absoluto = abs(x_next - x)
         erro_relativo = erro_absoluto / abs(x_next)
 
-        print('| {:10} | {:<20} | {:<25} | {:<25} | {:<25} | {:<25}|'.format(iteracoes, x_next, x_prev, f(x), erro_absoluto, erro_relativo))
+        if rastro is not None:
+            rastro.registrar(iteracoes, x_next, f_next, erro_absoluto, erro_relativo)
 
         if erro_relativo < tol:
             return x_next, iteracoes
         
-        x_prev = x
-        x = x_next
+        x_prev, f_prev = x, fx
+        x, fx = x_next, f_next
         
     return None, iteracoes
 
@@ -34,9 +40,10 @@ x0 = 3.0
 x1 = 1.0
 
 print("Método de Quase-Newton")
-print('| {:10} | {:<20} | {:<25} | {:<25} | {:<25} | {:<25}|'.format("iteracoes", "x_next", "x_prev", "f(x)", "erro_absoluto", "erro_relativo"))
 
-raiz, iteracoes = quase_newton(f, x0, x1)
+rastro = Rastro()
+raiz, iteracoes = quase_newton(f, x0, x1, rastro=rastro)
+print(rastro.tabela())
 
 if raiz is not None:
     print("Convergiu em ", iteracoes, " para ", raiz)
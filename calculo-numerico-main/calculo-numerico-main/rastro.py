@@ -0,0 +1,55 @@
+
+import numpy as np
+
+
+CAMPOS = np.dtype([
+    ("iteracao", np.int64),
+    ("x", np.float64),
+    ("fx", np.float64),
+    ("erro_absoluto", np.float64),
+    ("erro_relativo", np.float64),
+])
+
+
+class Rastro:
+    # Guarda as iterações de um método num array estruturado do NumPy já alocado.
+    # Quando a capacidade acaba, as iterações mais antigas são sobrescritas (buffer circular).
+    # Os métodos só chamam registrar() quando recebem um Rastro, então sem ele não há custo extra.
+
+    def __init__(self, capacidade=1024):
+        self.capacidade = capacidade
+        self.buffer = np.zeros(capacidade, dtype=CAMPOS)
+        self.total = 0
+
+    def registrar(self, iteracao, x, fx, erro_absoluto, erro_relativo):
+        self.buffer[self.total % self.capacidade] = (iteracao, x, fx, erro_absoluto, erro_relativo)
+        self.total += 1
+
+    def __len__(self):
+        return min(self.total, self.capacidade)
+
+    def dados(self):
+        # Retorna as iterações guardadas, da mais antiga para a mais recente
+        if self.total <= self.capacidade:
+            return self.buffer[:self.total].copy()
+        inicio = self.total % self.capacidade
+        return np.concatenate((self.buffer[inicio:], self.buffer[:inicio]))
+
+    def limpar(self):
+        self.total = 0
+
+    def tabela(self):
+        linhas = ['| {:^10} | {:^25} | {:^25} | {:^25} | {:^25}|'.format(
+            "iteracoes", "x", "f(x)", "erro_absoluto", "erro_relativo")]
+        for linha in self.dados():
+            linhas.append('| {:10} | {:<25} | {:<25} | {:<25} | {:<25}|'.format(
+                int(linha["iteracao"]), float(linha["x"]), float(linha["fx"]),
+                float(linha["erro_absoluto"]), float(linha["erro_relativo"])))
+        return "\n".join(linhas)
+
+    def salvar_npy(self, caminho):
+        np.save(caminho, self.dados())
+
+    def salvar_csv(self, caminho):
+        np.savetxt(caminho, self.dados(), delimiter=",", header=",".join(CAMPOS.names), comments="",
+                   fmt=["%d", "%.17g", "%.17g", "%.17g", "%.17g"])
@@ -9,11 +9,12 @@ def decomposicao_LU_pivot(A):
         Matriz quadrada de coeficientes do sistema.
 
     Retorno:
-    P, L, U : np.array, np.array, np.array
-        Matrizes de permutação, triangular inferior e triangular superior, respectivamente.
+    piv, L, U : np.array, np.array, np.array
+        Vetor de pivôs (a linha i de PA é a linha piv[i] de A, então Pb = b[piv]),
+        matriz triangular inferior e triangular superior, respectivamente.
     """
     n = len(A)
-    P = np.eye(n)  # Matriz identidade para armazenar permutações
+    piv = np.arange(n)  # Vetor de pivôs no lugar da matriz de permutação (n inteiros em vez de n²)
     L = np.eye(n)  # Matriz triangular inferior inicializada como identidade
     U = A.astype(float)  # Copia de A para iniciar U
 
@@ -22,7 +23,7 @@ def decomposicao_LU_pivot(A):
         pivot = np.argmax(np.abs(U[k:, k])) + k
         if pivot != k:
             U[[k, pivot]] = U[[pivot, k]]  # Troca linhas em U
-            P[[k, pivot]] = P[[pivot, k]]  # Troca linhas em P
+            piv[[k, pivot]] = piv[[pivot, k]]  # Troca os índices no vetor de pivôs
             if k > 0:
                 L[[k, pivot], :k] = L[[pivot, k], :k]  # Troca linhas em L
 
@@ -31,7 +32,52 @@ def decomposicao_LU_pivot(A):
             L[i, k] = U[i, k] / U[k, k]
             U[i, k:] -= L[i, k] * U[k, k:]
 
-    return P, L, U
+    return piv, L, U
+
+class FatoracaoLU:
+    """
+    Guarda a decomposição LU de A para resolver vários sistemas com a mesma matriz.
+
+    L e U ficam juntas em uma única matriz (os multiplicadores de L abaixo da
+    diagonal e U no resto) e a permutação fica num vetor de índices, então cada
+    novo b custa só as substituições, sem refazer a decomposição.
+
+    Parâmetros:
+    A : np.array
+        Matriz quadrada de coeficientes do sistema.
+    """
+
+    def __init__(self, A):
+        piv, L, U = decomposicao_LU_pivot(np.asarray(A))
+        self.LU = np.tril(L, -1) + U
+        self.piv = piv  # Pb = b[piv]
+
+    def solve(self, B):
+        """
+        Resolve AX = B para um vetor ou para vários lados direitos de uma vez.
+
+        Parâmetros:
+        B : np.array
+            Vetor de tamanho n ou matriz (n, k), uma coluna por sistema.
+
+        Retorno:
+        X : np.array
+            Solução com o mesmo formato de B.
+        """
+        n = len(self.LU)
+        # Aplica a permutação e resolve todas as colunas juntas
+        y = np.array(B, dtype=float)[self.piv]
+
+        # Resolução de Ly = Pb (substituição direta)
+        for i in range(n):
+            y[i] -= np.dot(self.LU[i, :i], y[:i])
+
+        # Resolução de Ux = y (substituição retroativa)
+        x = y
+        for i in range(n-1, -1, -1):
+            x[i] = (y[i] - np.dot(self.LU[i, i+1:], x[i+1:])) / self.LU[i, i]
+
+        return x
 
 def resolver_sistema_LU(A, b):
     """
@@ -47,20 +93,4 @@ def resolver_sistema_LU(A, b):
     x : np.array
         Solução do sistema.
     """
-    P, L, U = decomposicao_LU_pivot(A)
-    
-    # Resolver Pb = L(Ux) = b
-    b_modificado = np.dot(P, b)
-
-    # Resolução de Ly = Pb (substituição direta)
-    n = len(b)
-    y = np.zeros(n)
-    for i in range(n):
-        y[i] = b_modificado[i] - np.dot(L[i, :i], y[:i])
-
-    # Resolução de Ux = y (substituição retroativa)
-    x = np.zeros(n)
-    for i in range(n-1, -1, -1):
-        x[i] = (y[i] - np.dot(U[i, i+1:], x[i+1:])) / U[i, i]
-
-    return x
+    return FatoracaoLU(A).solve(b)